@@ -3,15 +3,19 @@ PDF2Video — Streamlit Web UI
 Upload a PDF and generate a cinematic video with AI narration.
 """
 
+import io
+import shutil
 import subprocess
 import streamlit as st
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image
 from core.config import Config
 from core.content_input import content_from_text_and_images
 from core.pipeline import PDF2VideoPipeline
+from core.utils import ensure_rgb
 
 # ── Page Config ─────────────────────────────────────────
 
@@ -50,6 +54,75 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# ── Helpers ─────────────────────────────────────────────
+
+
+@st.cache_resource
+def _detect_nvenc() -> bool:
+    """Probe FFmpeg once per server process for the NVENC encoder."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=5,
+        )
+        return "h264_nvenc" in result.stdout
+    except Exception:
+        return False
+
+
+@st.cache_resource(max_entries=4)
+def _get_pipeline(api_key: str, size: tuple[int, int], fps: int) -> PDF2VideoPipeline:
+    """
+    Share one pipeline per (api_key, size, fps). The OpenAI clients and the
+    composer snapshot these from Config at construction, so they form the key.
+    """
+    return PDF2VideoPipeline()
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _pdf_preview_png(pdf_bytes: bytes) -> tuple[int, bytes]:
+    """Render page 1 of a PDF at half scale — returns (page_count, png_bytes)."""
+    import fitz
+
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        pix = doc[0].get_pixmap(matrix=fitz.Matrix(0.5, 0.5), alpha=False)
+        return len(doc), pix.tobytes("png")
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _load_video_bytes(path: str, mtime: float) -> bytes:
+    """Read a rendered video once; mtime is part of the cache key."""
+    return Path(path).read_bytes()
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _thumbnail_png(image_bytes: bytes) -> bytes:
+    """Downscale an uploaded image to a 256 px PNG for the preview grid."""
+    img = Image.open(io.BytesIO(image_bytes))
+    img.thumbnail((256, 256), Image.Resampling.BILINEAR)
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA")
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _spill_upload(uploaded, suffix: str) -> Path:
+    """Stream a Streamlit upload to a temp file in 1 MiB chunks."""
+    uploaded.seek(0)
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+        shutil.copyfileobj(uploaded, tmp, length=1024 * 1024)
+        return Path(tmp.name)
+
+
+def _decode_upload(uploaded) -> tuple[Image.Image | None, Exception | None]:
+    """Decode an uploaded image to RGB — returns (image, None) or (None, error)."""
+    try:
+        return ensure_rgb(Image.open(uploaded)), None
+    except Exception as e:
+        return None, e
+
+
 # ── Header ──────────────────────────────────────────────
 
 st.markdown('<div class="main-header"><h1>🎬 PDF2Video</h1></div>', unsafe_allow_html=True)
@@ -124,15 +197,7 @@ with st.sidebar:
 
     st.divider()
     st.subheader("🖥️ GPU Status")
-    # Quick GPU check
-    try:
-        result = subprocess.run(
-            ["ffmpeg", "-hide_banner", "-encoders"],
-            capture_output=True, text=True, timeout=5,
-        )
-        has_nvenc = "h264_nvenc" in result.stdout
-    except Exception:
-        has_nvenc = False
+    has_nvenc = _detect_nvenc()
 
     if has_nvenc:
         st.success("✅ NVIDIA NVENC detected")
@@ -162,23 +227,13 @@ with tab_pdf:
             # PDF Preview
             with st.expander("📋 PDF Preview", expanded=False):
                 try:
-                    import fitz
-                    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-                        tmp.write(uploaded_file.getvalue())
-                        tmp_path = tmp.name
-                    try:
-                        doc = fitz.open(tmp_path)
-                        st.caption(f"Pages: {len(doc)}")
-                        page = doc[0]
-                        pix = page.get_pixmap(matrix=fitz.Matrix(0.5, 0.5))
-                        st.image(
-                            pix.tobytes("png"),
-                            caption="Page 1 preview",
-                            use_container_width=True,
-                        )
-                        doc.close()
-                    finally:
-                        Path(tmp_path).unlink(missing_ok=True)
+                    page_count, preview_png = _pdf_preview_png(uploaded_file.getvalue())
+                    st.caption(f"Pages: {page_count}")
+                    st.image(
+                        preview_png,
+                        caption="Page 1 preview",
+                        use_container_width=True,
+                    )
                 except Exception as e:
                     st.error(f"Preview failed: {e}")
 
@@ -196,19 +251,12 @@ with tab_pdf:
                 Config.VIDEO_FPS = fps
 
                 # Save uploaded PDF to temp file
-                with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_pdf:
-                    tmp_pdf.write(uploaded_file.getvalue())
-                    pdf_path = Path(tmp_pdf.name)
+                pdf_path = _spill_upload(uploaded_file, ".pdf")
 
                 # Save music if provided
                 music_path = None
                 if music_file:
-                    with tempfile.NamedTemporaryFile(
-                        suffix=f".{music_file.name.split('.')[-1]}",
-                        delete=False,
-                    ) as tmp_music:
-                        tmp_music.write(music_file.getvalue())
-                        music_path = tmp_music.name
+                    music_path = _spill_upload(music_file, f".{music_file.name.split('.')[-1]}")
 
                 # Progress tracking
                 progress_bar = st.progress(0)
@@ -221,7 +269,7 @@ with tab_pdf:
                 try:
                     start = time.time()
 
-                    pipeline = PDF2VideoPipeline()
+                    pipeline = _get_pipeline(api_key, (w, h), fps)
                     output_path = Config.OUTPUT_DIR / f"{uploaded_file.name.rsplit('.', 1)[0]}_video.mp4"
 
                     result_path = pipeline.run(
@@ -242,16 +290,15 @@ with tab_pdf:
 
                     if result_path.exists():
                         st.video(str(result_path))
-                        with open(result_path, "rb") as f:
-                            st.download_button(
-                                label="⬇️ Download Video",
-                                data=f.read(),
-                                file_name=result_path.name,
-                                mime="video/mp4",
-                                type="primary",
-                                use_container_width=True,
-                                key="pdf_download",
-                            )
+                        st.download_button(
+                            label="⬇️ Download Video",
+                            data=_load_video_bytes(str(result_path), result_path.stat().st_mtime),
+                            file_name=result_path.name,
+                            mime="video/mp4",
+                            type="primary",
+                            use_container_width=True,
+                            key="pdf_download",
+                        )
 
                 except Exception as e:
                     st.error(f"❌ Error: {str(e)}")
@@ -303,7 +350,7 @@ with tab_text:
             for i, img_file in enumerate(uploaded_images):
                 with preview_cols[i % len(preview_cols)]:
                     st.image(
-                        img_file,
+                        _thumbnail_png(img_file.getvalue()),
                         caption=img_file.name,
                         use_container_width=True,
                     )
@@ -336,16 +383,18 @@ with tab_text:
                 Config.VIDEO_SIZE = (w, h)
                 Config.VIDEO_FPS = fps
 
-                # Load uploaded images as PIL
+                # Load uploaded images as PIL — decode in parallel (Pillow releases the GIL)
                 pil_images = []
                 image_labels = []
-                for img_file in (uploaded_images or []):
-                    try:
-                        pil_img = Image.open(img_file).convert("RGB")
+                if uploaded_images:
+                    with ThreadPoolExecutor(max_workers=min(8, len(uploaded_images))) as pool:
+                        decoded = list(pool.map(_decode_upload, uploaded_images))
+                    for img_file, (pil_img, error) in zip(uploaded_images, decoded):
+                        if pil_img is None:
+                            st.warning(f"Could not load {img_file.name}: {error}")
+                            continue
                         pil_images.append(pil_img)
                         image_labels.append(img_file.name)
-                    except Exception as e:
-                        st.warning(f"Could not load {img_file.name}: {e}")
 
                 # Build ContentInput
                 content = content_from_text_and_images(
@@ -358,12 +407,7 @@ with tab_text:
                 # Save music if provided
                 music_path = None
                 if music_file:
-                    with tempfile.NamedTemporaryFile(
-                        suffix=f".{music_file.name.split('.')[-1]}",
-                        delete=False,
-                    ) as tmp_music:
-                        tmp_music.write(music_file.getvalue())
-                        music_path = tmp_music.name
+                    music_path = _spill_upload(music_file, f".{music_file.name.split('.')[-1]}")
 
                 # Progress tracking
                 progress_bar = st.progress(0)
@@ -376,7 +420,7 @@ with tab_text:
                 try:
                     start = time.time()
 
-                    pipeline = PDF2VideoPipeline()
+                    pipeline = _get_pipeline(api_key, (w, h), fps)
 
                     result_path = pipeline.run_from_content(
                         content=content,
@@ -395,16 +439,15 @@ with tab_text:
 
                     if result_path.exists():
                         st.video(str(result_path))
-                        with open(result_path, "rb") as f:
-                            st.download_button(
-                                label="⬇️ Download Video",
-                                data=f.read(),
-                                file_name=result_path.name,
-                                mime="video/mp4",
-                                type="primary",
-                                use_container_width=True,
-                                key="text_download",
-                            )
+                        st.download_button(
+                            label="⬇️ Download Video",
+                            data=_load_video_bytes(str(result_path), result_path.stat().st_mtime),
+                            file_name=result_path.name,
+                            mime="video/mp4",
+                            type="primary",
+                            use_container_width=True,
+                            key="text_download",
+                        )
 
                 except Exception as e:
                     st.error(f"❌ Error: {str(e)}")
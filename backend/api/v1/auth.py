@@ -4,14 +4,21 @@ import uuid
 
 import jwt
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.db.session import get_db
 from backend.dependencies import get_current_user
 from backend.models.user import User
-from backend.schemas.auth import LoginRequest, RegisterRequest, TokenResponse, UserResponse
-from backend.services.auth_service import AuthService
-from backend.utils.security import decode_token
+from backend.schemas.auth import (
+    LoginRequest,
+    RefreshRequest,
+    RegisterRequest,
+    TokenResponse,
+    UserResponse,
+)
+from backend.services.auth_service import AuthService, invalidate_user_cache
+from backend.utils.security import decode_token_cached
 from backend.config import settings
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -66,25 +73,27 @@ async def refresh_token(
     """Exchange a refresh token (from cookie or body) for a new access token."""
     token = request.cookies.get("refresh_token")
     if not token:
-        # Try JSON body as fallback
+        # Fall back to a JSON body; malformed bodies are treated as "no token"
         try:
-            body = await request.json()
-            token = body.get("refresh_token")
-        except Exception:
-            pass
+            token = RefreshRequest.model_validate_json(await request.body()).refresh_token
+        except ValidationError:
+            token = None
     if not token:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="No refresh token")
-    refresh_token = token
 
     try:
-        payload = decode_token(refresh_token)
+        payload = decode_token_cached(token)
     except jwt.PyJWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
 
     if payload.get("type") != "refresh":
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token type")
 
-    user_id = uuid.UUID(payload["sub"])
+    try:
+        user_id = uuid.UUID(payload.get("sub"))
+    except (AttributeError, TypeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+
     service = AuthService(db)
     result = await service.refresh_tokens(user_id)
     if not result:
@@ -96,7 +105,13 @@ async def refresh_token(
 
 
 @router.post("/logout")
-async def logout(response: Response):
+async def logout(request: Request, response: Response):
+    token = request.cookies.get("refresh_token")
+    if token:
+        try:
+            invalidate_user_cache(uuid.UUID(decode_token_cached(token)["sub"]))
+        except (jwt.PyJWTError, KeyError, ValueError):
+            pass
     response.delete_cookie("refresh_token", path="/api/v1/auth")
     return {"message": "Logged out"}
 
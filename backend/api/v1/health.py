@@ -1,25 +1,32 @@
 """Health check endpoints."""
 
 import subprocess
+from functools import lru_cache
+
 from fastapi import APIRouter
 
 router = APIRouter(prefix="/health", tags=["health"])
 
 
-@router.get("")
-async def health_check():
-    return {"status": "ok"}
-
-
-@router.get("/gpu")
-async def gpu_check():
+@lru_cache(maxsize=1)
+def _nvenc_available() -> bool:
+    """Check FFmpeg for NVENC once per process — the encoder set doesn't change at runtime."""
     try:
         result = subprocess.run(
             ["ffmpeg", "-hide_banner", "-encoders"],
             capture_output=True, text=True, timeout=5,
         )
-        has_nvenc = "h264_nvenc" in result.stdout
+        return "h264_nvenc" in result.stdout
     except Exception:
-        has_nvenc = False
+        return False
 
+
+@router.get("")
+async def health_check():
+    return {"status": "ok"}
+
+
+@router.get("/gpu")
+async def gpu_check():
+    has_nvenc = _nvenc_available()
     return {"nvenc_available": has_nvenc, "encoder": "h264_nvenc" if has_nvenc else "libx264"}
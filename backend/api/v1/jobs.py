@@ -2,104 +2,94 @@
 
 import asyncio
 import uuid
+from collections.abc import Iterable
+from pathlib import Path
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.db.session import get_db
 from backend.dependencies import get_current_user
+from backend.models.upload import Upload
 from backend.models.user import User
 from backend.schemas.job import JobCreate, JobListResponse, JobResponse
 from backend.services.job_service import JobService
-from backend.services.upload_service import UploadService
-from backend.services.video_service import VideoService
+from backend.utils.cache import cached_response, response_cache
 from backend.utils.progress import progress_manager
-from backend.utils.storage import get_storage
-from backend.workers.video_worker import run_video_job
+from backend.utils.storage import LocalStorage, get_storage
+from backend.workers.queue import enqueue
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
+# Job rows change as renders finish, so list pages are only cached briefly
+JOB_LIST_CACHE_TTL = 30
+
+# Validates a whole page in one call instead of per-item model_validate
+_job_list_adapter = TypeAdapter(list[JobResponse])
+
 
 @router.post("", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
 async def create_job(
     payload: JobCreate,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    storage: LocalStorage = Depends(get_storage),
 ):
     job_service = JobService(db)
     job = await job_service.create_job(payload, user.id)
     await db.commit()
+    await response_cache.invalidate("jobs", user.id)
 
-    # Resolve upload paths for the worker
-    storage = get_storage()
-    upload_service = UploadService(db, storage)
-
-    pdf_path = None
-    if payload.pdf_upload_id:
-        pdf_path = await upload_service.get_upload_path(payload.pdf_upload_id, user.id)
+    # The linked uploads came back with the job; resolve storage paths in parallel
+    uploads = {u.id: u for u in job.uploads}
+    paths = await _retrieve_paths(storage, uploads.values())
 
+    pdf_path = paths.get(payload.pdf_upload_id)
+    music_path = paths.get(payload.music_upload_id)
     image_paths = []
     image_labels = []
     for img_id in payload.image_upload_ids:
-        upload = await upload_service.get_upload(img_id, user.id)
-        if upload:
-            try:
-                p = await storage.retrieve(upload.stored_path)
-                image_paths.append(p)
-                image_labels.append(upload.original_filename)
-            except FileNotFoundError:
-                pass
-
-    music_path = None
-    if payload.music_upload_id:
-        music_path = await upload_service.get_upload_path(payload.music_upload_id, user.id)
-
-    # Dispatch to background worker
-    async def _run_and_finalize():
-        async with (await _get_fresh_session()) as session:
-            js = JobService(session)
-            vs = VideoService(session, storage)
-            try:
-                result_path = await run_video_job(
-                    job_id=job.id,
-                    user_id=user.id,
-                    source_type=payload.source_type,
-                    title=payload.title,
-                    job_settings=payload.settings.model_dump(),
-                    pdf_path=pdf_path,
-                    image_paths=image_paths,
-                    image_labels=image_labels,
-                    music_path=music_path,
-                    text_content=payload.text_content,
-                )
-                # Create video record
-                video = await vs.create_video(
-                    user_id=user.id,
-                    title=payload.title,
-                    local_path=result_path,
-                    resolution=payload.settings.resolution,
-                )
-                await js.set_video_id(job.id, video.id)
-                await js.update_progress(job.id, "completed", "Complete!", 1.0)
-                await session.commit()
-            except Exception as e:
-                await js.fail_job(job.id, str(e))
-                await session.commit()
-            finally:
-                progress_manager.remove(job.id)
-
-    asyncio.create_task(_run_and_finalize())
+        if img_id in paths:
+            image_paths.append(paths[img_id])
+            image_labels.append(uploads[img_id].original_filename)
+
+    # Hand off to the job runner
+    await enqueue(job.id, {
+        "user_id": str(user.id),
+        "title": payload.title,
+        "resolution": payload.settings.resolution,
+        "source_type": payload.source_type,
+        "job_settings": payload.settings.model_dump(),
+        "pdf_path": pdf_path,
+        "image_paths": image_paths,
+        "image_labels": image_labels,
+        "music_path": music_path,
+        "text_content": payload.text_content,
+    })
 
     return job
 
 
-async def _get_fresh_session():
-    """Create a fresh async session for background tasks."""
-    from backend.db.session import async_session_factory
-    return async_session_factory()
+async def _retrieve_paths(storage: LocalStorage, uploads: Iterable[Upload]) -> dict[uuid.UUID, Path]:
+    """Resolve stored files concurrently — uploads whose files are gone are left out."""
+    uploads = list(uploads)
+    results = await asyncio.gather(
+        *(storage.retrieve(u.stored_path) for u in uploads),
+        return_exceptions=True,
+    )
+    paths = {}
+    for upload, result in zip(uploads, results):
+        if isinstance(result, FileNotFoundError):
+            continue
+        if isinstance(result, BaseException):
+            raise result
+        paths[upload.id] = result
+    return paths
 
 
 @router.get("", response_model=JobListResponse)
+@cached_response("jobs", JOB_LIST_CACHE_TTL, key_params=("page", "page_size", "status_filter"))
 async def list_jobs(
     page: int = 1,
     page_size: int = 20,
@@ -110,7 +100,7 @@ async def list_jobs(
     service = JobService(db)
     jobs, total = await service.list_jobs(user.id, page, page_size, status_filter)
     return JobListResponse(
-        items=[JobResponse.model_validate(j) for j in jobs],
+        items=_job_list_adapter.validate_python(jobs),
         total=total,
         page=page,
         page_size=page_size,
@@ -140,6 +130,8 @@ async def cancel_job(
     success = await service.cancel_job(job_id, user.id)
     if not success:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found or cannot be cancelled")
+    await db.commit()
+    await response_cache.invalidate("jobs", user.id)
     progress_manager.update(job_id, "cancelled", "Cancelled", 0.0)
     return {"message": "Job cancelled"}
 
@@ -149,6 +141,7 @@ async def retry_job(
     job_id: uuid.UUID,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    storage: LocalStorage = Depends(get_storage),
 ):
     """Retry a failed or cancelled job — clones it with the same settings and re-dispatches."""
     service = JobService(db)
@@ -159,10 +152,10 @@ async def retry_job(
             detail="Job not found or is not in a retryable state (must be failed or cancelled)",
         )
     await db.commit()
+    await response_cache.invalidate("jobs", user.id)
 
-    # Resolve upload paths for the new job
-    storage = get_storage()
-    upload_service = UploadService(db, storage)
+    # Resolve upload paths for the new job (retry_job loads them with the new job)
+    paths = await _retrieve_paths(storage, new_job.uploads)
 
     pdf_path = None
     image_paths = []
@@ -170,9 +163,8 @@ async def retry_job(
     music_path = None
 
     for upload in new_job.uploads:
-        try:
-            p = await storage.retrieve(upload.stored_path)
-        except FileNotFoundError:
+        p = paths.get(upload.id)
+        if p is None:
             continue
         if upload.file_type == "pdf":
             pdf_path = p
@@ -182,40 +174,19 @@ async def retry_job(
         elif upload.file_type == "music":
             music_path = p
 
-    # Dispatch to background worker
-    async def _run_and_finalize():
-        async with (await _get_fresh_session()) as session:
-            js = JobService(session)
-            vs = VideoService(session, storage)
-            try:
-                result_path = await run_video_job(
-                    job_id=new_job.id,
-                    user_id=user.id,
-                    source_type=new_job.source_type,
-                    title=new_job.title,
-                    job_settings=new_job.settings,
-                    pdf_path=pdf_path,
-                    image_paths=image_paths,
-                    image_labels=image_labels,
-                    music_path=music_path,
-                    text_content=new_job.text_content,
-                )
-                video = await vs.create_video(
-                    user_id=user.id,
-                    title=new_job.title,
-                    local_path=result_path,
-                    resolution=new_job.settings.get("resolution", "1920x1080"),
-                )
-                await js.set_video_id(new_job.id, video.id)
-                await js.update_progress(new_job.id, "completed", "Complete!", 1.0)
-                await session.commit()
-            except Exception as e:
-                await js.fail_job(new_job.id, str(e))
-                await session.commit()
-            finally:
-                progress_manager.remove(new_job.id)
-
-    asyncio.create_task(_run_and_finalize())
+    # Hand off to the job runner
+    await enqueue(new_job.id, {
+        "user_id": str(user.id),
+        "title": new_job.title,
+        "resolution": new_job.settings.get("resolution", "1920x1080"),
+        "source_type": new_job.source_type,
+        "job_settings": new_job.settings,
+        "pdf_path": pdf_path,
+        "image_paths": image_paths,
+        "image_labels": image_labels,
+        "music_path": music_path,
+        "text_content": new_job.text_content,
+    })
     return new_job
 
 
@@ -229,4 +200,6 @@ async def delete_job(
     success = await service.delete_job(job_id, user.id)
     if not success:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    await db.commit()
+    await response_cache.invalidate("jobs", user.id)
     return {"message": "Job deleted"}
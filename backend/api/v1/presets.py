@@ -3,10 +3,12 @@
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.db.session import get_db
 from backend.dependencies import get_current_user
+from backend.models.preset import Preset
 from backend.models.user import User
 from backend.schemas.preset import (
     PresetCreate,
@@ -15,11 +17,25 @@ from backend.schemas.preset import (
     PresetUpdate,
 )
 from backend.services.preset_service import PresetService
+from backend.utils.cache import cached_response, response_cache
 
 router = APIRouter(prefix="/presets", tags=["presets"])
 
+PRESET_LIST_CACHE_TTL = 300
+
+# Validates a whole page in one call instead of per-item model_validate
+_preset_list_adapter = TypeAdapter(list[PresetResponse])
+
+
+def _written_preset_response(preset: Preset) -> PresetResponse:
+    """Wrap a row this request just wrote — its values are already typed, so skip validation."""
+    return PresetResponse.model_construct(
+        **{name: getattr(preset, name) for name in PresetResponse.model_fields}
+    )
+
 
 @router.get("", response_model=PresetListResponse)
+@cached_response("presets", PRESET_LIST_CACHE_TTL)
 async def list_presets(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
@@ -27,21 +43,23 @@ async def list_presets(
     service = PresetService(db)
     presets = await service.list_presets(user.id)
     return PresetListResponse(
-        items=[PresetResponse.model_validate(p) for p in presets],
+        items=_preset_list_adapter.validate_python(presets),
         total=len(presets),
     )
 
 
 @router.get("/default", response_model=PresetResponse | None)
+@cached_response("presets", PRESET_LIST_CACHE_TTL)
 async def get_default_preset(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
+    # Shares the "presets" namespace, so every preset write below invalidates it
     service = PresetService(db)
     preset = await service.get_default_preset(user.id)
     if not preset:
         return None
-    return preset
+    return PresetResponse.model_validate(preset)
 
 
 @router.get("/{preset_id}", response_model=PresetResponse)
@@ -66,7 +84,8 @@ async def create_preset(
     service = PresetService(db)
     preset = await service.create_preset(payload, user.id)
     await db.commit()
-    return preset
+    await response_cache.invalidate("presets", user.id)
+    return _written_preset_response(preset)
 
 
 @router.put("/{preset_id}", response_model=PresetResponse)
@@ -81,7 +100,8 @@ async def update_preset(
     if not preset:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Preset not found")
     await db.commit()
-    return preset
+    await response_cache.invalidate("presets", user.id)
+    return _written_preset_response(preset)
 
 
 @router.delete("/{preset_id}")
@@ -95,4 +115,5 @@ async def delete_preset(
     if not success:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Preset not found")
     await db.commit()
+    await response_cache.invalidate("presets", user.id)
     return {"message": "Preset deleted"}
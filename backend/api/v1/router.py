@@ -12,8 +12,9 @@ from backend.api.v1.videos import router as videos_router
 
 v1_router = APIRouter(prefix="/api/v1")
 
-v1_router.include_router(auth_router)
+# Health first — load-balancer probes match before any auth-dependent route
 v1_router.include_router(health_router)
+v1_router.include_router(auth_router)
 v1_router.include_router(jobs_router)
 v1_router.include_router(jobs_progress_router)
 v1_router.include_router(presets_router)
@@ -1,6 +1,7 @@
 """Upload API routes — PDF, images, music."""
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.db.session import get_db
@@ -8,23 +9,32 @@ from backend.dependencies import get_current_user
 from backend.models.user import User
 from backend.schemas.upload import UploadResponse
 from backend.services.upload_service import UploadService
-from backend.utils.storage import get_storage
+from backend.utils.storage import LocalStorage, get_storage
 
 router = APIRouter(prefix="/uploads", tags=["uploads"])
 
+_upload_list_adapter = TypeAdapter(list[UploadResponse])
+
+
+def _created_uploads_response(uploads) -> Response:
+    """Validate and serialize the new rows in one pydantic-core pass; FastAPI would redo both."""
+    body = _upload_list_adapter.dump_json(_upload_list_adapter.validate_python(uploads))
+    return Response(content=body, status_code=status.HTTP_201_CREATED, media_type="application/json")
+
 
 @router.post("/pdf", response_model=list[UploadResponse], status_code=status.HTTP_201_CREATED)
 async def upload_pdf(
     files: list[UploadFile] = File(...),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    storage: LocalStorage = Depends(get_storage),
 ):
-    service = UploadService(db, get_storage())
+    service = UploadService(db, storage)
     try:
         uploads = await service.save_multiple(files, "pdf", user.id)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    return uploads
+    return _created_uploads_response(uploads)
 
 
 @router.post("/images", response_model=list[UploadResponse], status_code=status.HTTP_201_CREATED)
@@ -32,13 +42,14 @@ async def upload_images(
     files: list[UploadFile] = File(...),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    storage: LocalStorage = Depends(get_storage),
 ):
-    service = UploadService(db, get_storage())
+    service = UploadService(db, storage)
     try:
         uploads = await service.save_multiple(files, "image", user.id)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    return uploads
+    return _created_uploads_response(uploads)
 
 
 @router.post("/music", response_model=list[UploadResponse], status_code=status.HTTP_201_CREATED)
@@ -46,10 +57,11 @@ async def upload_music(
     files: list[UploadFile] = File(...),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    storage: LocalStorage = Depends(get_storage),
 ):
-    service = UploadService(db, get_storage())
+    service = UploadService(db, storage)
     try:
         uploads = await service.save_multiple(files, "music", user.id)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    return uploads
+    return _created_uploads_response(uploads)
@@ -4,6 +4,7 @@ import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import FileResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.db.session import get_db
@@ -11,22 +12,30 @@ from backend.dependencies import get_current_user
 from backend.models.user import User
 from backend.schemas.video import VideoListResponse, VideoResponse
 from backend.services.video_service import VideoService
-from backend.utils.storage import get_storage
+from backend.utils.cache import cached_response, response_cache
+from backend.utils.storage import LocalStorage, get_storage
 
 router = APIRouter(prefix="/videos", tags=["videos"])
 
+VIDEO_LIST_CACHE_TTL = 300
+
+# Validates a whole page in one call instead of per-item model_validate
+_video_list_adapter = TypeAdapter(list[VideoResponse])
+
 
 @router.get("", response_model=VideoListResponse)
+@cached_response("videos", VIDEO_LIST_CACHE_TTL, key_params=("page", "page_size"))
 async def list_videos(
     page: int = 1,
     page_size: int = 20,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    storage: LocalStorage = Depends(get_storage),
 ):
-    service = VideoService(db, get_storage())
+    service = VideoService(db, storage)
     videos, total = await service.list_videos(user.id, page, page_size)
     return VideoListResponse(
-        items=[VideoResponse.model_validate(v) for v in videos],
+        items=_video_list_adapter.validate_python(videos),
         total=total,
         page=page,
         page_size=page_size,
@@ -38,8 +47,9 @@ async def get_video(
     video_id: uuid.UUID,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    storage: LocalStorage = Depends(get_storage),
 ):
-    service = VideoService(db, get_storage())
+    service = VideoService(db, storage)
     video = await service.get_video(video_id, user.id)
     if not video:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video not found")
@@ -51,12 +61,20 @@ async def stream_video(
     video_id: uuid.UUID,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    storage: LocalStorage = Depends(get_storage),
 ):
-    service = VideoService(db, get_storage())
+    service = VideoService(db, storage)
     path = await service.get_file_path(video_id, user.id)
     if not path:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video not found")
-    return FileResponse(path, media_type="video/mp4")
+    # FileResponse answers Range requests itself; renders are written with
+    # +faststart so seeking never needs the tail of the file first.
+    # Private: the URL is per-user, so only the browser may cache it.
+    return FileResponse(
+        path,
+        media_type="video/mp4",
+        headers={"Accept-Ranges": "bytes", "Cache-Control": "private, max-age=3600"},
+    )
 
 
 @router.get("/{video_id}/download")
@@ -64,12 +82,13 @@ async def download_video(
     video_id: uuid.UUID,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    storage: LocalStorage = Depends(get_storage),
 ):
-    service = VideoService(db, get_storage())
-    video = await service.get_video(video_id, user.id)
-    if not video:
+    service = VideoService(db, storage)
+    found = await service.get_video_with_path(video_id, user.id)
+    if not found:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video not found")
-    path = await service.get_file_path(video_id, user.id)
+    video, path = found
     if not path:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video file not found")
     return FileResponse(
@@ -85,9 +104,12 @@ async def delete_video(
     video_id: uuid.UUID,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    storage: LocalStorage = Depends(get_storage),
 ):
-    service = VideoService(db, get_storage())
+    service = VideoService(db, storage)
     success = await service.delete_video(video_id, user.id)
     if not success:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video not found")
+    await db.commit()
+    await response_cache.invalidate("videos", user.id)
     return {"message": "Video deleted"}
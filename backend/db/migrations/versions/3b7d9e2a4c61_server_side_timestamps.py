@@ -0,0 +1,40 @@
+"""server-side timestamp defaults
+
+Revision ID: 3b7d9e2a4c61
+Revises: f453c119ec5e
+Create Date: 2026-10-15 09:12:44.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7d9e2a4c61'
+down_revision: Union[str, Sequence[str], None] = 'f453c119ec5e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs that now default to now() in the database
+_TIMESTAMP_COLUMNS = [
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+    ('presets', 'created_at'),
+    ('presets', 'updated_at'),
+    ('videos', 'created_at'),
+    ('jobs', 'created_at'),
+    ('uploads', 'created_at'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in _TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in _TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
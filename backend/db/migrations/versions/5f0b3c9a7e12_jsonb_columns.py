@@ -0,0 +1,48 @@
+"""json columns to jsonb
+
+Revision ID: 5f0b3c9a7e12
+Revises: c2a5e8d17f34
+Create Date: 2026-10-15 15:02:51.774093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '5f0b3c9a7e12'
+down_revision: Union[str, Sequence[str], None] = 'c2a5e8d17f34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs stored as binary JSONB instead of JSON text.
+# Each ALTER rewrites its table under an exclusive lock — run in a quiet window.
+_JSON_COLUMNS = [
+    ('jobs', 'settings'),
+    ('presets', 'settings'),
+    ('videos', 'metadata_json'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in _JSON_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_type=postgresql.JSON(astext_type=sa.Text()),
+            postgresql_using=f'{column}::jsonb',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in _JSON_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSON(astext_type=sa.Text()),
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            postgresql_using=f'{column}::json',
+        )
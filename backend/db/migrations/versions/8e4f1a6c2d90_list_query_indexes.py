@@ -0,0 +1,59 @@
+"""composite indexes for list queries
+
+Revision ID: 8e4f1a6c2d90
+Revises: 3b7d9e2a4c61
+Create Date: 2026-10-15 10:03:27.905113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4f1a6c2d90'
+down_revision: Union[str, Sequence[str], None] = '3b7d9e2a4c61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY can't run inside a transaction; build without locking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_jobs_user_created', 'jobs',
+            ['user_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_jobs_user_status_created', 'jobs',
+            ['user_id', 'status', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_videos_user_created', 'videos',
+            ['user_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_presets_user_default_created', 'presets',
+            ['user_id', sa.text('is_default DESC'), sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
+        # user_id alone is now a prefix of the composites above
+        op.drop_index('ix_jobs_user_id', table_name='jobs', postgresql_concurrently=True)
+        op.drop_index('ix_videos_user_id', table_name='videos', postgresql_concurrently=True)
+        op.drop_index('ix_presets_user_id', table_name='presets', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_presets_user_id', 'presets', ['user_id'], postgresql_concurrently=True)
+        op.create_index('ix_videos_user_id', 'videos', ['user_id'], postgresql_concurrently=True)
+        op.create_index('ix_jobs_user_id', 'jobs', ['user_id'], postgresql_concurrently=True)
+        op.drop_index('ix_presets_user_default_created', table_name='presets', postgresql_concurrently=True)
+        op.drop_index('ix_videos_user_created', table_name='videos', postgresql_concurrently=True)
+        op.drop_index('ix_jobs_user_status_created', table_name='jobs', postgresql_concurrently=True)
+        op.drop_index('ix_jobs_user_created', table_name='jobs', postgresql_concurrently=True)
@@ -0,0 +1,48 @@
+"""path columns to text
+
+Revision ID: a91d4e6b0c57
+Revises: 5f0b3c9a7e12
+Create Date: 2026-10-15 15:48:13.602417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a91d4e6b0c57'
+down_revision: Union[str, Sequence[str], None] = '5f0b3c9a7e12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, nullable) — VARCHAR(512) -> TEXT is a catalog-only change
+# in Postgres, no table rewrite
+_PATH_COLUMNS = [
+    ('uploads', 'stored_path', False),
+    ('videos', 'file_path', False),
+    ('videos', 'thumbnail_path', True),
+    ('users', 'openai_api_key_encrypted', True),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, nullable in _PATH_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.Text(),
+            existing_type=sa.String(length=512),
+            existing_nullable=nullable,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, nullable in _PATH_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.String(length=512),
+            existing_type=sa.Text(),
+            existing_nullable=nullable,
+        )
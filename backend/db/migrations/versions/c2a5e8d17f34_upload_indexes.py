@@ -0,0 +1,42 @@
+"""upload indexes
+
+Revision ID: c2a5e8d17f34
+Revises: 8e4f1a6c2d90
+Create Date: 2026-10-15 14:21:09.318260
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2a5e8d17f34'
+down_revision: Union[str, Sequence[str], None] = '8e4f1a6c2d90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY can't run inside a transaction; build without locking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_uploads_user_created', 'uploads',
+            ['user_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f('ix_uploads_job_id'), 'uploads', ['job_id'],
+            postgresql_concurrently=True,
+        )
+        # user_id alone is now a prefix of ix_uploads_user_created
+        op.drop_index('ix_uploads_user_id', table_name='uploads', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_uploads_user_id', 'uploads', ['user_id'], postgresql_concurrently=True)
+        op.drop_index(op.f('ix_uploads_job_id'), table_name='uploads', postgresql_concurrently=True)
+        op.drop_index('ix_uploads_user_created', table_name='uploads', postgresql_concurrently=True)
@@ -1,15 +1,35 @@
 """SQLAlchemy async engine and session factory."""
 
+import asyncio
+
+import orjson
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from backend.config import settings
 
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_pre_ping=False,
+    connect_args={
+        # asyncpg: short OLTP queries never benefit from JIT; cap runaway statements
+        "server_settings": {"jit": "off"},
+        "command_timeout": 30,
+        # Repeated point lookups reuse their server-side prepared statement
+        # instead of re-parsing and re-planning on every execute
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    },
+    # JSONB settings/metadata columns: asyncpg's json codecs call these per value
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
 )
 
 async_session_factory = async_sessionmaker(
@@ -19,6 +39,16 @@ async_session_factory = async_sessionmaker(
 )
 
 
+async def warm_pool(connections: int) -> None:
+    """Open `connections` pooled connections up front so early requests skip the connect cost."""
+
+    async def _ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_ping() for _ in range(connections)))
+
+
 async def get_db() -> AsyncSession:  # type: ignore[misc]
     """Dependency that yields an async DB session."""
     async with async_session_factory() as session:
@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.db.session import get_db
 from backend.models.user import User
 from backend.services.auth_service import AuthService
-from backend.utils.security import decode_token
+from backend.utils.security import decode_token_cached
 from backend.utils.storage import LocalStorage, get_storage
 
 security_scheme = HTTPBearer(auto_error=False)
@@ -25,7 +25,7 @@ async def get_current_user(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
 
     try:
-        payload = decode_token(credentials.credentials)
+        payload = decode_token_cached(credentials.credentials)
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired")
     except jwt.PyJWTError:
@@ -34,7 +34,10 @@ async def get_current_user(
     if payload.get("type") != "access":
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token type")
 
-    user_id = uuid.UUID(payload["sub"])
+    try:
+        user_id = uuid.UUID(payload.get("sub"))
+    except (AttributeError, TypeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
     auth_service = AuthService(db)
     user = await auth_service.get_user_by_id(user_id)
     if not user or not user.is_active:
@@ -7,12 +7,14 @@ from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from backend.api.v1.router import v1_router
 from backend.config import settings
 from backend.db.base import Base
-from backend.db.session import engine
+from backend.db.session import engine, warm_pool
 from backend.middleware.error_handler import ErrorHandlerMiddleware, RequestIdMiddleware
 
 
@@ -23,6 +25,9 @@ async def lifespan(app: FastAPI):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    # Pre-open the pool so the first burst of requests doesn't serialize on connects
+    await warm_pool(settings.DB_POOL_SIZE)
+
     # Ensure storage directories exist
     for subdir in ("uploads/pdf", "uploads/image", "uploads/music", "videos", "temp"):
         (settings.STORAGE_LOCAL_PATH / subdir).mkdir(parents=True, exist_ok=True)
@@ -39,11 +44,15 @@ def create_app() -> FastAPI:
         description="Backend API for the PDF2Video cinematic generation pipeline.",
         version="2.0.0",
         lifespan=lifespan,
+        # orjson handles the UUIDs/datetimes in every response model natively
+        default_response_class=ORJSONResponse,
     )
 
     # ── Middleware (order matters — outermost first) ──────
     app.add_middleware(RequestIdMiddleware)
     app.add_middleware(ErrorHandlerMiddleware)
+    # Compress JSON list pages; Starlette skips video/*, images and SSE streams
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.CORS_ORIGINS,
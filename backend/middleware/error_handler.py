@@ -1,30 +1,67 @@
 """Global exception handler middleware."""
 
-import uuid
-from fastapi import Request
+import secrets
+
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Pure ASGI classes rather than BaseHTTPMiddleware — that wrapper runs every
+# request through an extra task and memory stream.
+
+
+class ErrorHandlerMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
 
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
-            return JSONResponse(
+            # Once headers are out we can't swap in an error response
+            if response_started:
+                raise
+            response = JSONResponse(
                 status_code=500,
                 content={
                     "code": "INTERNAL_ERROR",
                     "message": str(exc),
                 },
             )
+            await response(scope, receive, send)
+
+
+# Load-balancer probes skip per-request bookkeeping
+HEALTH_PATH_PREFIX = "/api/v1/health"
+
+
+class RequestIdMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(HEALTH_PATH_PREFIX):
+            await self.app(scope, receive, send)
+            return
+
+        request_id = secrets.token_hex(4)
+        scope.setdefault("state", {})["request_id"] = request_id
 
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        request_id = str(uuid.uuid4())[:8]
-        request.state.request_id = request_id
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-        return response
+        await self.app(scope, receive, send_with_request_id)
@@ -1,10 +1,10 @@
 """Job ORM model."""
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.db.base import Base
@@ -12,22 +12,31 @@ from backend.db.base import Base
 
 class Job(Base):
     __tablename__ = "jobs"
+    # Fetch server-generated timestamps via RETURNING instead of lazy-loading later
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     status: Mapped[str] = mapped_column(String(20), default="pending", index=True)
     source_type: Mapped[str] = mapped_column(String(20), nullable=False)  # "pdf" | "text_images"
     title: Mapped[str] = mapped_column(String(255), nullable=False, default="Untitled")
     text_content: Mapped[str | None] = mapped_column(Text, nullable=True)
-    settings: Mapped[dict] = mapped_column(JSON, default=dict)
+    settings: Mapped[dict] = mapped_column(JSONB, default=dict)
     progress: Mapped[float] = mapped_column(Float, default=0.0)
     current_step: Mapped[str] = mapped_column(String(100), default="Queued")
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     video_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("videos.id"), nullable=True)
 
     user = relationship("User", back_populates="jobs")
     video = relationship("Video", back_populates="job", foreign_keys=[video_id], uselist=False)
-    uploads = relationship("Upload", back_populates="job", lazy="selectin")
+    # Load explicitly with selectinload() — an implicit lazy load is an error under asyncio
+    uploads = relationship("Upload", back_populates="job", lazy="raise_on_sql")
+
+    # Match list_jobs: per-user pages newest-first, optionally filtered by status
+    __table_args__ = (
+        Index("ix_jobs_user_created", "user_id", created_at.desc()),
+        Index("ix_jobs_user_status_created", "user_id", "status", created_at.desc()),
+    )
@@ -1,9 +1,9 @@
 """User ORM model."""
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String
+from sqlalchemy import Boolean, DateTime, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,21 +12,25 @@ from backend.db.base import Base
 
 class User(Base):
     __tablename__ = "users"
+    # Fetch server-generated timestamps via RETURNING instead of lazy-loading later
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email: Mapped[str] = mapped_column(String(320), unique=True, index=True, nullable=False)
     password_hash: Mapped[str] = mapped_column(String(128), nullable=False)
     display_name: Mapped[str] = mapped_column(String(100), nullable=False, default="")
-    openai_api_key_encrypted: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    openai_api_key_encrypted: Mapped[str | None] = mapped_column(Text, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
-    jobs = relationship("Job", back_populates="user", lazy="selectin")
-    videos = relationship("Video", back_populates="user", lazy="selectin")
-    uploads = relationship("Upload", back_populates="user", lazy="selectin")
-    presets = relationship("Preset", back_populates="user", lazy="selectin")
+    # Every authenticated request loads a User — never drag its history along.
+    # Opt in per query with selectinload(User.jobs) etc. where it's needed.
+    jobs = relationship("Job", back_populates="user", lazy="raise_on_sql")
+    videos = relationship("Video", back_populates="user", lazy="raise_on_sql")
+    uploads = relationship("Upload", back_populates="user", lazy="raise_on_sql")
+    presets = relationship("Preset", back_populates="user", lazy="raise_on_sql")
@@ -43,7 +43,7 @@ class JobResponse(BaseModel):
     video_id: uuid.UUID | None = None
     settings: dict = {}
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class JobListResponse(BaseModel):
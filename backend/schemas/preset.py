@@ -35,7 +35,7 @@ class PresetResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class PresetListResponse(BaseModel):
@@ -14,4 +14,4 @@ class UploadResponse(BaseModel):
     file_type: str
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
@@ -14,7 +14,7 @@ class VideoResponse(BaseModel):
     thumbnail_url: str | None = None
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class VideoListResponse(BaseModel):
@@ -1,11 +1,15 @@
 """Authentication service — register, login, token management."""
 
+import hashlib
+import hmac
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.config import settings
 from backend.models.user import User
+from backend.utils.cache import TTLCache
 from backend.utils.security import (
     create_access_token,
     create_refresh_token,
@@ -13,6 +17,33 @@ from backend.utils.security import (
     verify_password,
 )
 
+# Hot lookups built once at import: executing a prebuilt statement skips
+# constructing the select and hashing it for the compiled cache per call
+_USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
+# user_id -> (email, is_active) for the token refresh path
+_refresh_user_cache = TTLCache(maxsize=10_000, ttl=30)
+# user_id -> User for per-request authentication; entries are expunged from
+# their session on insert and must be treated as read-only
+_user_cache = TTLCache(maxsize=10_000, ttl=10)
+# HMAC of (email, password, stored hash) -> True for recently verified logins.
+# Skips the deliberately slow hash check on repeat logins; the stored hash is
+# part of the key, so a password change invalidates entries on its own.
+_login_cache = TTLCache(maxsize=1024, ttl=10)
+
+
+def _login_cache_key(email: str, password: str, password_hash: str) -> bytes:
+    """Keyed digest so neither plaintext nor an offline-crackable hash sits in memory."""
+    msg = "\0".join((email, password, password_hash)).encode()
+    return hmac.new(settings.JWT_SECRET_KEY.encode(), msg, hashlib.sha256).digest()
+
+
+def invalidate_user_cache(user_id: uuid.UUID) -> None:
+    """Drop cached user state so the next lookup re-reads the DB."""
+    _refresh_user_cache.pop(user_id)
+    _user_cache.pop(user_id)
+
 
 class AuthService:
     def __init__(self, db: AsyncSession):
@@ -20,7 +51,7 @@ class AuthService:
 
     async def register(self, email: str, password: str, display_name: str = "") -> tuple[User, str, str]:
         """Create a new user and return (user, access_token, refresh_token)."""
-        existing = await self.db.execute(select(User).where(User.email == email))
+        existing = await self.db.execute(_USER_BY_EMAIL, {"email": email})
         if existing.scalar_one_or_none():
             raise ValueError("Email already registered")
 
@@ -38,10 +69,16 @@ class AuthService:
 
     async def login(self, email: str, password: str) -> tuple[User, str, str]:
         """Authenticate and return (user, access_token, refresh_token)."""
-        result = await self.db.execute(select(User).where(User.email == email))
+        result = await self.db.execute(_USER_BY_EMAIL, {"email": email})
         user = result.scalar_one_or_none()
-        if not user or not verify_password(password, user.password_hash):
+        if not user:
             raise ValueError("Invalid email or password")
+        key = _login_cache_key(email, password, user.password_hash)
+        if _login_cache.get(key) is None:
+            # Only successful verifications are cached
+            if not verify_password(password, user.password_hash):
+                raise ValueError("Invalid email or password")
+            _login_cache.set(key, True)
         if not user.is_active:
             raise ValueError("Account is disabled")
 
@@ -50,14 +87,30 @@ class AuthService:
         return user, access, refresh
 
     async def get_user_by_id(self, user_id: uuid.UUID) -> User | None:
-        result = await self.db.execute(select(User).where(User.id == user_id))
-        return result.scalar_one_or_none()
+        user = _user_cache.get(user_id)
+        if user is None:
+            result = await self.db.execute(_USER_BY_ID, {"user_id": user_id})
+            user = result.scalar_one_or_none()
+            if user is not None:
+                # Detach before sharing across requests: the instance must not
+                # stay bound to (and keep alive) this request's session
+                self.db.expunge(user)
+                _user_cache.set(user_id, user)
+        return user
 
     async def refresh_tokens(self, user_id: uuid.UUID) -> tuple[str, str] | None:
         """Issue new token pair for an existing user."""
-        user = await self.get_user_by_id(user_id)
-        if not user or not user.is_active:
+        cached = _refresh_user_cache.get(user_id)
+        if cached is None:
+            user = await self.get_user_by_id(user_id)
+            if not user:
+                return None
+            cached = (user.email, user.is_active)
+            _refresh_user_cache.set(user_id, cached)
+
+        email, is_active = cached
+        if not is_active:
             return None
-        access = create_access_token(user.id, user.email)
-        refresh = create_refresh_token(user.id)
+        access = create_access_token(user_id, email)
+        refresh = create_refresh_token(user_id)
         return access, refresh
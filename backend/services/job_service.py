@@ -3,21 +3,31 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+from sqlalchemy.orm.attributes import set_committed_value
 
 from backend.models.job import Job
 from backend.models.upload import Upload
 from backend.schemas.job import JobCreate
 
+_JOB_FOR_USER = select(Job).where(Job.id == bindparam("job_id"), Job.user_id == bindparam("user_id"))
+
 
 class JobService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
     async def create_job(self, payload: JobCreate, user_id: uuid.UUID) -> Job:
-        """Create a new job record and link uploads."""
+        """Create a new job record and link uploads; job.uploads comes back populated.
+
+        Nothing is flushed here unless uploads need linking — the caller's
+        commit writes the job.
+        """
         job = Job(
+            # Client-side id so uploads can reference the job before it's flushed
+            id=uuid.uuid4(),
             user_id=user_id,
             source_type=payload.source_type,
             title=payload.title,
@@ -27,7 +37,6 @@ class JobService:
             current_step="Queued",
         )
         self.db.add(job)
-        await self.db.flush()
 
         # Link uploads to this job
         upload_ids: list[uuid.UUID] = []
@@ -37,22 +46,29 @@ class JobService:
         if payload.music_upload_id:
             upload_ids.append(payload.music_upload_id)
 
+        uploads: list[Upload] = []
         if upload_ids:
+            # Autoflush sends the job INSERT first; RETURNING hands back the
+            # linked rows so the caller needn't select them again
             result = await self.db.execute(
-                select(Upload).where(Upload.id.in_(upload_ids), Upload.user_id == user_id)
+                update(Upload)
+                .where(Upload.id.in_(upload_ids), Upload.user_id == user_id)
+                .values(job_id=job.id)
+                .returning(Upload)
             )
-            for upload in result.scalars():
-                upload.job_id = job.id
+            uploads = list(result.scalars())
+        set_committed_value(job, "uploads", uploads)
 
-        await self.db.flush()
         return job
 
     async def get_job(self, job_id: uuid.UUID, user_id: uuid.UUID) -> Job | None:
-        result = await self.db.execute(
-            select(Job).where(Job.id == job_id, Job.user_id == user_id)
-        )
+        result = await self.db.execute(_JOB_FOR_USER, {"job_id": job_id, "user_id": user_id})
         return result.scalar_one_or_none()
 
+    async def get_status(self, job_id: uuid.UUID) -> str | None:
+        """Current status of any user's job, or None if it no longer exists."""
+        return await self.db.scalar(select(Job.status).where(Job.id == job_id))
+
     async def list_jobs(
         self,
         user_id: uuid.UUID,
@@ -61,44 +77,47 @@ class JobService:
         status: str | None = None,
     ) -> tuple[list[Job], int]:
         """Return (jobs, total_count) for a user with optional status filter."""
-        query = select(Job).where(Job.user_id == user_id)
-        count_query = select(func.count()).select_from(Job).where(Job.user_id == user_id)
-
+        filters = [Job.user_id == user_id]
         if status:
-            query = query.where(Job.status == status)
-            count_query = count_query.where(Job.status == status)
-
-        query = query.order_by(Job.created_at.desc()).offset((page - 1) * page_size).limit(page_size)
-
-        result = await self.db.execute(query)
-        jobs = list(result.scalars().all())
-
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar() or 0
+            filters.append(Job.status == status)
+
+        # One round-trip: the window count rides along on every page row
+        query = (
+            select(Job, func.count().over().label("total"))
+            .where(*filters)
+            # JobResponse never shows the source text, which can run to megabytes
+            .options(defer(Job.text_content, raiseload=True))
+            .order_by(Job.created_at.desc())
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )
+        rows = (await self.db.execute(query)).all()
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+        if page == 1:
+            return [], 0
 
-        return jobs, total
+        # Past the last page there's no row to carry the total — count separately
+        total = await self.db.scalar(select(func.count()).select_from(Job).where(*filters))
+        return [], total or 0
 
     async def update_progress(
         self, job_id: uuid.UUID, status: str, step: str, progress: float
     ) -> None:
-        result = await self.db.execute(select(Job).where(Job.id == job_id))
-        job = result.scalar_one_or_none()
-        if job:
-            job.status = status
-            job.current_step = step
-            job.progress = progress
-            if status == "completed":
-                job.completed_at = datetime.now(timezone.utc)
-            elif status in ("classifying", "scripting", "voiceover", "backgrounds", "composing", "exporting") and not job.started_at:
-                job.started_at = datetime.now(timezone.utc)
+        # Single UPDATE per tick — no SELECT, no ORM load of the row
+        values = {"status": status, "current_step": step, "progress": progress}
+        if status == "completed":
+            values["completed_at"] = func.now()
+        elif status in ("classifying", "scripting", "voiceover", "backgrounds", "composing", "exporting"):
+            values["started_at"] = func.coalesce(Job.started_at, func.now())
+        await self.db.execute(update(Job).where(Job.id == job_id).values(**values))
 
     async def fail_job(self, job_id: uuid.UUID, error: str) -> None:
-        result = await self.db.execute(select(Job).where(Job.id == job_id))
-        job = result.scalar_one_or_none()
-        if job:
-            job.status = "failed"
-            job.error_message = error
-            job.completed_at = datetime.now(timezone.utc)
+        await self.db.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(status="failed", error_message=error, completed_at=func.now())
+        )
 
     async def cancel_job(self, job_id: uuid.UUID, user_id: uuid.UUID) -> bool:
         job = await self.get_job(job_id, user_id)
@@ -118,10 +137,7 @@ class JobService:
         return True
 
     async def set_video_id(self, job_id: uuid.UUID, video_id: uuid.UUID) -> None:
-        result = await self.db.execute(select(Job).where(Job.id == job_id))
-        job = result.scalar_one_or_none()
-        if job:
-            job.video_id = video_id
+        await self.db.execute(update(Job).where(Job.id == job_id).values(video_id=video_id))
 
     async def retry_job(self, job_id: uuid.UUID, user_id: uuid.UUID) -> Job | None:
         """Clone a failed/cancelled job as a new pending job with the same settings."""
@@ -132,6 +148,7 @@ class JobService:
             return None
 
         new_job = Job(
+            id=uuid.uuid4(),
             user_id=user_id,
             source_type=original.source_type,
             title=f"{original.title} (retry)",
@@ -141,16 +158,15 @@ class JobService:
             current_step="Queued",
         )
         self.db.add(new_job)
-        await self.db.flush()
 
         # Re-link the same uploads to the new job
-        from backend.models.upload import Upload
         result = await self.db.execute(
             select(Upload).where(Upload.job_id == job_id)
         )
-        for upload in result.scalars():
+        new_uploads = [
             # Create a reference — uploads can be shared
-            new_upload = Upload(
+            Upload(
+                id=uuid.uuid4(),
                 user_id=user_id,
                 job_id=new_job.id,
                 file_type=upload.file_type,
@@ -159,7 +175,11 @@ class JobService:
                 file_size=upload.file_size,
                 mime_type=upload.mime_type,
             )
-            self.db.add(new_upload)
+            for upload in result.scalars()
+        ]
+        self.db.add_all(new_uploads)
 
-        await self.db.flush()
+        # Callers iterate new_job.uploads; hand them the rows we just built
+        # rather than re-selecting (the relationship won't lazy-load)
+        set_committed_value(new_job, "uploads", new_uploads)
         return new_job
@@ -2,12 +2,15 @@
 
 import uuid
 
-from sqlalchemy import func, select, update
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.models.preset import Preset
 from backend.schemas.preset import PresetCreate, PresetUpdate
 
+_PRESET_FOR_USER = select(Preset).where(Preset.id == bindparam("preset_id"), Preset.user_id == bindparam("user_id"))
+_DEFAULT_PRESET = select(Preset).where(Preset.user_id == bindparam("user_id"), Preset.is_default == True)
+
 
 class PresetService:
     def __init__(self, db: AsyncSession):
@@ -38,15 +41,11 @@ class PresetService:
         return list(result.scalars().all())
 
     async def get_preset(self, preset_id: uuid.UUID, user_id: uuid.UUID) -> Preset | None:
-        result = await self.db.execute(
-            select(Preset).where(Preset.id == preset_id, Preset.user_id == user_id)
-        )
+        result = await self.db.execute(_PRESET_FOR_USER, {"preset_id": preset_id, "user_id": user_id})
         return result.scalar_one_or_none()
 
     async def get_default_preset(self, user_id: uuid.UUID) -> Preset | None:
-        result = await self.db.execute(
-            select(Preset).where(Preset.user_id == user_id, Preset.is_default == True)
-        )
+        result = await self.db.execute(_DEFAULT_PRESET, {"user_id": user_id})
         return result.scalar_one_or_none()
 
     async def update_preset(
@@ -1,9 +1,11 @@
 """Upload service — handle file uploads, validation, storage."""
 
+import asyncio
 import uuid
 from pathlib import Path
 
 from fastapi import UploadFile
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.config import settings
@@ -17,6 +19,45 @@ ALLOWED_MIME = {
     "music": {"audio/mpeg", "audio/wav", "audio/ogg", "audio/mp4", "audio/x-wav"},
 }
 
+# Bytes read from the front of an upload to identify its real type
+SNIFF_BYTES = 4096
+
+# ISO-BMFF major brands that mark an audio-only file; the same `ftyp` box
+# also fronts MP4/MOV video, HEIC/AVIF images and 3GP
+_AUDIO_MP4_BRANDS = {b"M4A ", b"M4B ", b"M4P ", b"F4A "}
+
+
+def _sniff_mime(header: bytes) -> str | None:
+    """Identify an upload from its leading magic bytes; None if unrecognised."""
+    if header.startswith(b"%PDF-"):
+        return "application/pdf"
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if header.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if header.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if header.startswith(b"BM"):
+        return "image/bmp"
+    if header.startswith(b"RIFF") and header[8:12] == b"WEBP":
+        return "image/webp"
+    if header.startswith(b"RIFF") and header[8:12] == b"WAVE":
+        return "audio/wav"
+    if header.startswith(b"OggS"):
+        return "audio/ogg"
+    if header[4:8] == b"ftyp":
+        return "audio/mp4" if header[8:12] in _AUDIO_MP4_BRANDS else None
+    # MP3: ID3v2 tag, or a bare MPEG audio frame sync
+    if header.startswith(b"ID3") or (len(header) > 1 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0):
+        return "audio/mpeg"
+    return None
+
+
+_UPLOAD_FOR_USER = select(Upload).where(Upload.id == bindparam("upload_id"), Upload.user_id == bindparam("user_id"))
+
+# Files copied into storage at once by save_multiple
+UPLOAD_CONCURRENCY = 8
+
 
 class UploadService:
     def __init__(self, db: AsyncSession, storage: LocalStorage):
@@ -31,33 +72,52 @@ class UploadService:
         job_id: uuid.UUID | None = None,
     ) -> Upload:
         """Validate and store an uploaded file, returning the Upload record."""
+        upload = await self._store_upload(file, file_type, user_id, job_id)
+        self.db.add(upload)
+        await self.db.flush()
+        return upload
+
+    async def _store_upload(
+        self,
+        file: UploadFile,
+        file_type: str,
+        user_id: uuid.UUID,
+        job_id: uuid.UUID | None = None,
+    ) -> Upload:
+        """Validate and copy a file into storage; the returned row is not yet added to the session."""
         if file_type not in ALLOWED_MIME:
             raise ValueError(f"Unknown file type: {file_type}")
 
-        mime = file.content_type or ""
-        if mime not in ALLOWED_MIME[file_type]:
-            raise ValueError(f"Invalid MIME type '{mime}' for {file_type} upload")
+        # Reject on the size Starlette already counted while parsing — no disk write needed
+        max_bytes = settings.MAX_UPLOAD_SIZE_MB << 20
+        too_large = f"File too large. Max is {settings.MAX_UPLOAD_SIZE_MB} MB."
+        if file.size is not None and file.size > max_bytes:
+            raise ValueError(too_large)
 
-        data = await file.read()
-        size_mb = len(data) / (1024 * 1024)
-        if size_mb > settings.MAX_UPLOAD_SIZE_MB:
-            raise ValueError(f"File too large ({size_mb:.1f} MB). Max is {settings.MAX_UPLOAD_SIZE_MB} MB.")
+        # Trust the file's magic bytes, not the client's Content-Type
+        await file.seek(0)
+        mime = _sniff_mime(await file.read(SNIFF_BYTES))
+        if mime not in ALLOWED_MIME[file_type]:
+            declared = file.content_type or "unknown"
+            raise ValueError(f"File content does not match a {file_type} upload (declared '{declared}')")
 
+        # Stream from Starlette's spooled temp file — never hold the whole body in memory
         key = self.storage.generate_key(user_id, f"uploads/{file_type}", file.filename or "file")
-        await self.storage.store_bytes(data, key)
+        await file.seek(0)
+        try:
+            file_size = await self.storage.store_fileobj(file.file, key, max_bytes=max_bytes)
+        except ValueError:
+            raise ValueError(too_large) from None
 
-        upload = Upload(
+        return Upload(
             user_id=user_id,
             job_id=job_id,
             file_type=file_type,
             original_filename=file.filename or "file",
             stored_path=key,
-            file_size=len(data),
+            file_size=file_size,
             mime_type=mime,
         )
-        self.db.add(upload)
-        await self.db.flush()
-        return upload
 
     async def save_multiple(
         self,
@@ -65,19 +125,40 @@ class UploadService:
         file_type: str,
         user_id: uuid.UUID,
     ) -> list[Upload]:
-        """Save multiple files of the same type."""
-        results = []
-        for f in files:
-            upload = await self.save_upload(f, file_type, user_id)
-            results.append(upload)
-        return results
+        """Save multiple files of the same type — copies run concurrently, one flush at the end."""
+        sem = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+
+        async def _one(f: UploadFile) -> Upload:
+            async with sem:
+                return await self._store_upload(f, file_type, user_id)
+
+        results = await asyncio.gather(*(_one(f) for f in files), return_exceptions=True)
+        uploads = [r for r in results if isinstance(r, Upload)]
+        failure = next((r for r in results if isinstance(r, BaseException)), None)
+        if failure is not None:
+            # All-or-nothing: don't leave the siblings' files behind without rows
+            await asyncio.gather(*(self.storage.delete(u.stored_path) for u in uploads))
+            raise failure
+
+        self.db.add_all(uploads)
+        await self.db.flush()
+        return uploads
 
     async def get_upload(self, upload_id: uuid.UUID, user_id: uuid.UUID) -> Upload | None:
-        from sqlalchemy import select
+        result = await self.db.execute(_UPLOAD_FOR_USER, {"upload_id": upload_id, "user_id": user_id})
+        return result.scalar_one_or_none()
+
+    async def get_uploads_bulk(
+        self, upload_ids: list[uuid.UUID], user_id: uuid.UUID
+    ) -> list[Upload]:
+        """Fetch several uploads in one query, returned in the order of upload_ids."""
+        if not upload_ids:
+            return []
         result = await self.db.execute(
-            select(Upload).where(Upload.id == upload_id, Upload.user_id == user_id)
+            select(Upload).where(Upload.id.in_(upload_ids), Upload.user_id == user_id)
         )
-        return result.scalar_one_or_none()
+        by_id = {u.id: u for u in result.scalars()}
+        return [by_id[i] for i in upload_ids if i in by_id]
 
     async def get_upload_path(self, upload_id: uuid.UUID, user_id: uuid.UUID) -> Path | None:
         upload = await self.get_upload(upload_id, user_id)
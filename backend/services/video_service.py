@@ -1,19 +1,49 @@
 """Video service — create records, serve files, generate thumbnails."""
 
+import asyncio
 import logging
-import subprocess
 import uuid
 from pathlib import Path
 
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
+try:
+    import av
+except ImportError:  # PyAV missing — probe with the ffprobe CLI instead
+    av = None
+
+from backend.config import settings
 from backend.models.video import Video
 from backend.utils.storage import LocalStorage
 
 logger = logging.getLogger(__name__)
 
 
+async def _run_tool(cmd: list[str], timeout: float) -> bytes:
+    """Run an ffmpeg-family tool as an asyncio subprocess and return its stdout."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL,
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return stdout
+
+
+def _av_duration(video_path: Path) -> float:
+    # Reads only the container header; no fork/exec of ffprobe
+    with av.open(str(video_path)) as container:
+        return (container.duration or 0) / av.time_base
+
+
+_VIDEO_FOR_USER = select(Video).where(Video.id == bindparam("video_id"), Video.user_id == bindparam("user_id"))
+
+
 class VideoService:
     def __init__(self, db: AsyncSession, storage: LocalStorage):
         self.db = db
@@ -31,16 +61,20 @@ class VideoService:
         """Store a generated video file and create a DB record."""
         file_size = local_path.stat().st_size if local_path.exists() else 0
 
-        # Probe duration from the video file
-        if duration_seconds == 0.0 and local_path.exists():
-            duration_seconds = self._probe_duration(local_path)
-
         key = self.storage.generate_key(user_id, "videos", f"{title}.mp4")
-        await self.storage.store(local_path, key)
-
-        # Generate thumbnail
         thumb_key = key.rsplit(".", 1)[0] + "_thumb.jpg"
-        thumb_path = await self._generate_thumbnail(local_path, thumb_key)
+
+        # Probe and thumbnail only read the source file — run them side by side
+        if duration_seconds == 0.0 and local_path.exists():
+            duration_seconds, thumb_path = await asyncio.gather(
+                self._probe_duration(local_path),
+                self._generate_thumbnail(local_path, thumb_key),
+            )
+        else:
+            thumb_path = await self._generate_thumbnail(local_path, thumb_key)
+
+        # The render is a throwaway temp file, so move rather than copy it
+        await self.storage.store_move(local_path, key)
 
         video = Video(
             user_id=user_id,
@@ -56,46 +90,63 @@ class VideoService:
         await self.db.flush()
         return video
 
-    def _probe_duration(self, video_path: Path) -> float:
-        """Use ffprobe to get video duration in seconds."""
+    async def _probe_duration(self, video_path: Path) -> float:
+        """Get video duration in seconds — libavformat in-process, else ffprobe."""
         try:
-            result = subprocess.run(
+            if av is not None:
+                return await asyncio.to_thread(_av_duration, video_path)
+            stdout = await _run_tool(
                 [
                     "ffprobe", "-v", "quiet", "-show_entries",
                     "format=duration", "-of", "csv=p=0", str(video_path),
                 ],
-                capture_output=True, text=True, timeout=10,
+                timeout=10,
             )
-            return float(result.stdout.strip())
+            return float(stdout.strip())
         except Exception as e:
             logger.warning("Failed to probe duration for %s: %s", video_path, e)
             return 0.0
 
+    @staticmethod
+    def _thumbnail_cmd(video_path: Path, thumb_local: Path, hwaccel: bool) -> list[str]:
+        cmd = ["ffmpeg", "-y"]
+        if hwaccel:
+            # Decode on the GPU (NVDEC); the one output frame is copied back for scaling
+            cmd += ["-hwaccel", "cuda"]
+        # Input-side seek: jump to the nearest keyframe instead of decoding from 0
+        cmd += [
+            "-ss", "2", "-i", str(video_path),
+            "-frames:v", "1",
+            "-vf", "scale=640:-1",
+            "-q:v", "3", str(thumb_local),
+        ]
+        return cmd
+
     async def _generate_thumbnail(self, video_path: Path, thumb_key: str) -> str | None:
         """Extract a frame at 2 seconds and store as thumbnail."""
         try:
             thumb_local = video_path.parent / f"{video_path.stem}_thumb.jpg"
-            subprocess.run(
-                [
-                    "ffmpeg", "-y", "-i", str(video_path),
-                    "-ss", "2", "-vframes", "1",
-                    "-vf", "scale=640:-1",
-                    "-q:v", "3", str(thumb_local),
-                ],
-                capture_output=True, timeout=15,
-            )
+            attempts = [True, False] if settings.FFMPEG_HWACCEL_DECODE else [False]
+            for hwaccel in attempts:
+                try:
+                    await _run_tool(self._thumbnail_cmd(video_path, thumb_local, hwaccel), timeout=15)
+                except (asyncio.TimeoutError, OSError) as e:
+                    # A hung or missing CUDA decode must still fall through to CPU;
+                    # drop any partial frame the killed attempt left behind
+                    logger.debug("Thumbnail attempt (hwaccel=%s) failed: %r", hwaccel, e)
+                    thumb_local.unlink(missing_ok=True)
+                    continue
+                if thumb_local.exists():
+                    break
             if thumb_local.exists():
-                await self.storage.store(thumb_local, thumb_key)
-                thumb_local.unlink(missing_ok=True)
+                await self.storage.store_move(thumb_local, thumb_key)
                 return thumb_key
         except Exception as e:
             logger.warning("Failed to generate thumbnail: %s", e)
         return None
 
     async def get_video(self, video_id: uuid.UUID, user_id: uuid.UUID) -> Video | None:
-        result = await self.db.execute(
-            select(Video).where(Video.id == video_id, Video.user_id == user_id)
-        )
+        result = await self.db.execute(_VIDEO_FOR_USER, {"video_id": video_id, "user_id": user_id})
         return result.scalar_one_or_none()
 
     async def list_videos(
@@ -104,31 +155,43 @@ class VideoService:
         page: int = 1,
         page_size: int = 20,
     ) -> tuple[list[Video], int]:
+        # One round-trip: the window count rides along on every page row
         query = (
-            select(Video)
+            select(Video, func.count().over().label("total"))
             .where(Video.user_id == user_id)
+            # Not part of VideoResponse — leave the JSONB blob in Postgres
+            .options(defer(Video.metadata_json, raiseload=True))
             .order_by(Video.created_at.desc())
             .offset((page - 1) * page_size)
             .limit(page_size)
         )
-        count_query = select(func.count()).select_from(Video).where(Video.user_id == user_id)
-
-        result = await self.db.execute(query)
-        videos = list(result.scalars().all())
-
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar() or 0
-
-        return videos, total
+        rows = (await self.db.execute(query)).all()
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+        if page == 1:
+            return [], 0
+
+        # Past the last page there's no row to carry the total — count separately
+        total = await self.db.scalar(
+            select(func.count()).select_from(Video).where(Video.user_id == user_id)
+        )
+        return [], total or 0
 
-    async def get_file_path(self, video_id: uuid.UUID, user_id: uuid.UUID) -> Path | None:
+    async def get_video_with_path(
+        self, video_id: uuid.UUID, user_id: uuid.UUID
+    ) -> tuple[Video, Path | None] | None:
+        """Fetch a video row and resolve its file in one lookup. Path is None if the file is gone."""
         video = await self.get_video(video_id, user_id)
         if not video:
             return None
         try:
-            return await self.storage.retrieve(video.file_path)
+            return video, await self.storage.retrieve(video.file_path)
         except FileNotFoundError:
-            return None
+            return video, None
+
+    async def get_file_path(self, video_id: uuid.UUID, user_id: uuid.UUID) -> Path | None:
+        found = await self.get_video_with_path(video_id, user_id)
+        return found[1] if found else None
 
     async def delete_video(self, video_id: uuid.UUID, user_id: uuid.UUID) -> bool:
         video = await self.get_video(video_id, user_id)
@@ -0,0 +1,235 @@
+"""
+Caching helpers.
+
+TTLCache is a small in-process LRU. The response cache layers it in front of
+Redis for per-user list endpoints, falling back to in-process only when
+Redis is unavailable.
+"""
+
+import functools
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+from fastapi import Response
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    Bounded LRU cache with per-entry expiry.
+    Not thread-safe — intended for use from the event loop thread.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# ── Shared list-response cache ───────────────────────────────────────
+#
+# Entries are keyed by (namespace, user_id, version, params). Invalidation
+# bumps the per-user version so every cached page for that user is orphaned
+# at once, without scanning for keys.
+
+# Entries kept in each process's front-tier cache
+LOCAL_CACHE_SIZE = 1024
+# Version counters outlive any cached page, so an expired counter never resurrects stale data
+VERSION_TTL_SECONDS = 86400
+
+
+def _params_key(params: tuple) -> str:
+    return ":".join("" if p is None else str(p) for p in params)
+
+
+class RedisResponseCache:
+    """
+    Two-tier response cache — per-process LRU in front of Redis.
+    Version counters live in Redis so invalidation reaches every worker.
+
+    Best effort: a Redis error is logged and treated as a miss (or a skipped
+    write), so the list endpoints keep serving from Postgres through a blip.
+    """
+
+    def __init__(self, redis_url: str):
+        self._redis_url = redis_url
+        self._redis = None
+        self._local = TTLCache(maxsize=LOCAL_CACHE_SIZE, ttl=VERSION_TTL_SECONDS)
+
+    async def _get_redis(self):
+        if self._redis is None:
+            import redis.asyncio as aioredis
+            self._redis = aioredis.from_url(self._redis_url)
+        return self._redis
+
+    def _version_key(self, namespace: str, user_id: uuid.UUID) -> str:
+        return f"cache:{namespace}:{user_id}:ver"
+
+    async def entry_key(self, namespace: str, user_id: uuid.UUID, params: tuple) -> str | None:
+        """Key for the user's current version, or None if Redis can't be read."""
+        from redis import RedisError
+
+        try:
+            r = await self._get_redis()
+            version = int(await r.get(self._version_key(namespace, user_id)) or 0)
+        except (RedisError, OSError) as e:
+            logger.warning("Response cache: version lookup failed (%s)", e)
+            return None
+        return f"cache:{namespace}:{user_id}:{version}:{_params_key(params)}"
+
+    async def get(self, key: str) -> bytes | None:
+        from redis import RedisError
+
+        body = self._local.get(key)
+        if body is not None:
+            return body
+        try:
+            r = await self._get_redis()
+            async with r.pipeline(transaction=False) as pipe:
+                pipe.get(key)
+                pipe.ttl(key)
+                body, remaining = await pipe.execute()
+        except (RedisError, OSError) as e:
+            logger.warning("Response cache: get failed (%s)", e)
+            return None
+        if body is not None and remaining > 0:
+            # Bound the local copy by what's left of the Redis TTL
+            self._local.set(key, body, ttl=remaining)
+        return body
+
+    async def set(self, key: str, body: bytes, ttl: int) -> None:
+        from redis import RedisError
+
+        try:
+            r = await self._get_redis()
+            await r.set(key, body, ex=ttl)
+        except (RedisError, OSError) as e:
+            logger.warning("Response cache: set failed (%s)", e)
+            return
+        self._local.set(key, body, ttl=ttl)
+
+    async def invalidate(self, namespace: str, user_id: uuid.UUID) -> None:
+        from redis import RedisError
+
+        key = self._version_key(namespace, user_id)
+        try:
+            r = await self._get_redis()
+            async with r.pipeline(transaction=False) as pipe:
+                pipe.incr(key)
+                pipe.expire(key, VERSION_TTL_SECONDS)
+                await pipe.execute()
+        except (RedisError, OSError) as e:
+            # Cached pages for this user go stale until their TTL runs out
+            logger.warning("Response cache: invalidate failed for %s/%s (%s)", namespace, user_id, e)
+
+
+class InMemoryResponseCache:
+    """In-memory response cache — single-process fallback."""
+
+    def __init__(self):
+        self._versions: dict[tuple[str, uuid.UUID], int] = {}
+        self._entries = TTLCache(maxsize=LOCAL_CACHE_SIZE, ttl=VERSION_TTL_SECONDS)
+
+    async def entry_key(self, namespace: str, user_id: uuid.UUID, params: tuple) -> tuple:
+        return (namespace, user_id, self._versions.get((namespace, user_id), 0), _params_key(params))
+
+    async def get(self, key: tuple) -> bytes | None:
+        return self._entries.get(key)
+
+    async def set(self, key: tuple, body: bytes, ttl: int) -> None:
+        self._entries.set(key, body, ttl=ttl)
+
+    async def invalidate(self, namespace: str, user_id: uuid.UUID) -> None:
+        key = (namespace, user_id)
+        self._versions[key] = self._versions.get(key, 0) + 1
+
+
+def _create_response_cache() -> RedisResponseCache | InMemoryResponseCache:
+    """Try Redis first; fall back to in-memory if unavailable."""
+    from backend.config import settings
+
+    if settings.REDIS_URL:
+        try:
+            import redis as sync_redis
+            r = sync_redis.from_url(settings.REDIS_URL, decode_responses=True, socket_connect_timeout=2)
+            r.ping()
+            r.close()
+            logger.info("Response cache: using Redis at %s", settings.REDIS_URL)
+            return RedisResponseCache(settings.REDIS_URL)
+        except Exception as e:
+            logger.warning("Redis unavailable (%s), falling back to in-memory response cache", e)
+
+    logger.info("Response cache: using in-memory fallback")
+    return InMemoryResponseCache()
+
+
+response_cache = _create_response_cache()
+
+
+def cached_response(namespace: str, ttl: int, key_params: tuple[str, ...] = ()):
+    """
+    Cache a per-user list endpoint's JSON body.
+
+    The wrapped endpoint must take `user` and return a Pydantic model (or None,
+    cached as JSON null). Endpoints sharing a namespace are keyed apart by
+    function name, so one invalidate() clears all of them. Both hits
+    and misses go out as a raw JSON Response: hits skip the DB query, and misses
+    reuse the bytes just cached instead of letting FastAPI re-validate and
+    re-serialize the model against `response_model`.
+    `key_params` names the query parameters that distinguish cached pages.
+    """
+
+    def decorator(fn: Callable[..., Awaitable[BaseModel | None]]):
+        @functools.wraps(fn)
+        async def wrapper(**kwargs):
+            user_id = kwargs["user"].id
+            params = (fn.__name__, *(kwargs.get(name) for name in key_params))
+            # Resolve the version once, before the query: a write that
+            # invalidates mid-miss then orphans this body instead of
+            # having it stored under the new version
+            key = await response_cache.entry_key(namespace, user_id, params)
+            if key is not None:
+                body = await response_cache.get(key)
+                if body is not None:
+                    return Response(content=body, media_type="application/json")
+
+            result = await fn(**kwargs)
+            body = b"null" if result is None else result.model_dump_json().encode()
+            if key is not None:
+                await response_cache.set(key, body, ttl)
+            return Response(content=body, media_type="application/json")
+
+        return wrapper
+
+    return decorator
@@ -2,18 +2,46 @@
 Progress tracking for video generation jobs.
 
 Uses Redis pub/sub when available for scalable multi-worker broadcasting.
-Falls back to an in-process asyncio Event mechanism when Redis is unavailable.
+Falls back to in-process per-subscriber asyncio queues when Redis is unavailable.
 """
 
 import asyncio
-import json
 import logging
+import queue
+import threading
 import uuid
 from dataclasses import dataclass, field
 from typing import AsyncGenerator
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Seconds of silence before an SSE keepalive comment is sent
+KEEPALIVE_SECONDS = 15.0
+KEEPALIVE_FRAME = b": keepalive\n\n"
+PROGRESS_FRAME_PREFIX = b"event: progress\ndata: "
+# Job state hashes expire this long after the last update
+STATE_TTL_SECONDS = 3600
+# Sockets shared by the pipeline threads publishing progress
+SYNC_POOL_SIZE = 16
+# Most queued progress writes folded into one Redis pipeline
+WRITE_BATCH_SIZE = 64
+# Frames buffered per in-memory subscriber; older ones are dropped when full
+SUBSCRIBER_QUEUE_SIZE = 8
+# Consecutive overflowing updates before a stalled subscriber is disconnected
+SLOW_SUBSCRIBER_TICKS = 32
+
+
+def _progress_frame(payload: bytes) -> bytes:
+    """Wrap an already-serialized JSON payload in an SSE progress frame."""
+    # SSE frames are ASCII — build bytes so the response needn't encode each chunk
+    return PROGRESS_FRAME_PREFIX + payload + b"\n\n"
+
+
+def _progress_event(data: dict) -> bytes:
+    return _progress_frame(orjson.dumps(data))
+
 
 # ── Redis-backed implementation ──────────────────────────────────────
 
@@ -24,15 +52,33 @@ class RedisProgressManager:
     """
 
     def __init__(self, redis_url: str):
-        self._redis_url = redis_url
-        self._redis = None
+        import redis as sync_redis
+        import redis.asyncio as aioredis
+
+        # Built eagerly (pools connect lazily) so worker threads never race to
+        # create their own. The blocking pool makes a burst of progress ticks
+        # wait for a warm socket instead of opening more connections.
+        self._sync_redis = sync_redis.Redis(
+            connection_pool=sync_redis.BlockingConnectionPool.from_url(
+                redis_url, decode_responses=True, max_connections=SYNC_POOL_SIZE,
+            )
+        )
+        self._redis = aioredis.Redis(
+            connection_pool=aioredis.ConnectionPool.from_url(redis_url, decode_responses=True)
+        )
+
+        # Pipeline threads only enqueue; a writer thread does the Redis I/O.
+        # Items are (job_id, data) for an update or (job_id, None) for a removal.
+        self._writes: queue.SimpleQueue[tuple[uuid.UUID, dict | None]] = queue.SimpleQueue()
+        threading.Thread(target=self._write_loop, name="progress-writer", daemon=True).start()
 
     async def _get_redis(self):
-        if self._redis is None:
-            import redis.asyncio as aioredis
-            self._redis = aioredis.from_url(self._redis_url, decode_responses=True)
         return self._redis
 
+    def _get_sync_redis(self):
+        # Shared by all worker threads — redis-py clients are thread-safe
+        return self._sync_redis
+
     def _channel(self, job_id: uuid.UUID) -> str:
         return f"job:{job_id}:progress"
 
@@ -45,23 +91,48 @@ class RedisProgressManager:
 
     def update(self, job_id: uuid.UUID, status: str, step: str, progress: float) -> None:
         """
-        Synchronous update — safe to call from worker threads.
-        Uses a sync Redis client to publish + store state.
+        Non-blocking update — safe to call from worker threads.
+        Queues the state for the writer thread; a lost tick on crash is harmless.
         """
-        import redis as sync_redis
-        r = sync_redis.from_url(self._redis_url, decode_responses=True)
-        data = {"status": status, "step": step, "progress": progress}
-        r.hset(self._hash_key(job_id), mapping=data)
-        r.publish(self._channel(job_id), json.dumps(data))
-        # Auto-expire state hash after 1 hour
-        r.expire(self._hash_key(job_id), 3600)
-        r.close()
+        self._writes.put((job_id, {"status": status, "step": step, "progress": progress}))
+
+    def _write_loop(self) -> None:
+        while True:
+            batch = [self._writes.get()]
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._writes.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                logger.warning("Dropped %d progress writes: %s", len(batch), e)
+
+    def _write_batch(self, batch: list[tuple[uuid.UUID, dict | None]]) -> None:
+        """Coalesce to the latest state per job and ship the lot as one pipeline."""
+        latest: dict[uuid.UUID, dict] = {}
+        removed: set[uuid.UUID] = set()
+        for job_id, data in batch:
+            if data is None:
+                removed.add(job_id)
+            else:
+                latest[job_id] = data
+                removed.discard(job_id)
+
+        with self._get_sync_redis().pipeline(transaction=False) as pipe:
+            for job_id, data in latest.items():
+                key = self._hash_key(job_id)
+                pipe.hset(key, mapping=data)
+                pipe.publish(self._channel(job_id), orjson.dumps(data))
+                pipe.expire(key, STATE_TTL_SECONDS)
+            # After the final publish, so subscribers still see the terminal state
+            for job_id in removed:
+                pipe.delete(self._hash_key(job_id))
+            pipe.execute()
 
     def get_sync(self, job_id: uuid.UUID) -> dict | None:
-        import redis as sync_redis
-        r = sync_redis.from_url(self._redis_url, decode_responses=True)
-        data = r.hgetall(self._hash_key(job_id))
-        r.close()
+        data = self._get_sync_redis().hgetall(self._hash_key(job_id))
         if not data:
             return None
         return {
@@ -71,58 +142,61 @@ class RedisProgressManager:
         }
 
     def remove(self, job_id: uuid.UUID) -> None:
-        import redis as sync_redis
-        r = sync_redis.from_url(self._redis_url, decode_responses=True)
-        r.delete(self._hash_key(job_id))
-        r.close()
+        # Queued behind the job's pending updates so it can't be undone by them
+        self._writes.put((job_id, None))
 
-    async def subscribe(self, job_id: uuid.UUID) -> AsyncGenerator[str, None]:
+    async def subscribe(self, job_id: uuid.UUID) -> AsyncGenerator[bytes, None]:
         """Yield SSE-formatted progress events via Redis pub/sub."""
         r = await self._get_redis()
 
-        # Yield current state from hash immediately
-        state = await r.hgetall(self._hash_key(job_id))
-        if state:
-            yield self._format_event("progress", {
-                "status": state.get("status", "unknown"),
-                "step": state.get("step", ""),
-                "progress": float(state.get("progress", 0)),
-            })
-            if state.get("status") in ("completed", "failed", "cancelled"):
-                return
-        else:
-            yield self._format_event("progress", {"status": "pending", "step": "Queued", "progress": 0})
-
-        # Subscribe to channel for live updates
+        # Subscribe before reading the snapshot so no update can slip between the two
         pubsub = r.pubsub()
         await pubsub.subscribe(self._channel(job_id))
 
         try:
-            while True:
-                msg = await asyncio.wait_for(
-                    pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0),
-                    timeout=30.0,
-                )
-                if msg is None:
-                    # Keepalive
-                    yield ": keepalive\n\n"
-                    continue
-
-                if msg["type"] == "message":
-                    data = json.loads(msg["data"])
-                    yield self._format_event("progress", data)
-                    if data.get("status") in ("completed", "failed", "cancelled"):
+            state = await r.hgetall(self._hash_key(job_id))
+            if state:
+                yield _progress_event({
+                    "status": state.get("status", "unknown"),
+                    "step": state.get("step", ""),
+                    "progress": float(state.get("progress", 0)),
+                })
+                if state.get("status") in ("completed", "failed", "cancelled"):
+                    return
+            else:
+                yield _progress_event({"status": "pending", "step": "Queued", "progress": 0})
+
+            # Same keepalive race as the in-memory manager: listen() blocks on the
+            # socket until a message lands, so an idle stream never wakes early
+            messages = pubsub.listen()
+            incoming = asyncio.create_task(anext(messages))
+            keepalive = asyncio.create_task(asyncio.sleep(KEEPALIVE_SECONDS))
+            try:
+                while True:
+                    done, _ = await asyncio.wait({incoming, keepalive}, return_when=asyncio.FIRST_COMPLETED)
+                    if incoming not in done:
+                        yield KEEPALIVE_FRAME
+                        keepalive = asyncio.create_task(asyncio.sleep(KEEPALIVE_SECONDS))
+                        continue
+
+                    msg = incoming.result()
+                    incoming = asyncio.create_task(anext(messages))
+                    if msg["type"] != "message":
+                        continue
+                    keepalive.cancel()
+                    keepalive = asyncio.create_task(asyncio.sleep(KEEPALIVE_SECONDS))
+
+                    # Forward the published JSON as-is; parse only to spot the end
+                    yield _progress_frame(msg["data"].encode())
+                    if orjson.loads(msg["data"]).get("status") in ("completed", "failed", "cancelled"):
                         break
-        except asyncio.TimeoutError:
-            yield ": keepalive\n\n"
+            finally:
+                incoming.cancel()
+                keepalive.cancel()
         finally:
             await pubsub.unsubscribe(self._channel(job_id))
             await pubsub.aclose()
 
-    @staticmethod
-    def _format_event(event_type: str, data: dict) -> str:
-        return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
-
 
 # ── In-memory fallback ───────────────────────────────────────────────
 
@@ -131,7 +205,9 @@ class JobProgressState:
     status: str = "pending"
     step: str = "Queued"
     progress: float = 0.0
-    event: asyncio.Event = field(default_factory=asyncio.Event)
+    # Subscriber queue → consecutive updates it was too full to take
+    subscribers: dict[asyncio.Queue, int] = field(default_factory=dict)
+    loop: asyncio.AbstractEventLoop | None = None
 
 
 class InMemoryProgressManager:
@@ -151,7 +227,36 @@ class InMemoryProgressManager:
         state.status = status
         state.step = step
         state.progress = progress
-        state.event.set()
+        if not state.subscribers:
+            return
+
+        # Serialized once here rather than once per subscriber
+        item = (status, _progress_event({"status": status, "step": step, "progress": progress}))
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is state.loop:
+            self._broadcast(state, item)
+        else:
+            # Pipeline threads report progress too; asyncio queues are loop-bound
+            state.loop.call_soon_threadsafe(self._broadcast, state, item)
+
+    @staticmethod
+    def _broadcast(state: JobProgressState, item: tuple[str, bytes]) -> None:
+        for q in list(state.subscribers):
+            if q.full():
+                # Drop the oldest frame — only the latest progress matters
+                q.get_nowait()
+                misses = state.subscribers[q] + 1
+                if misses >= SLOW_SUBSCRIBER_TICKS:
+                    del state.subscribers[q]
+                    q.put_nowait(None)  # tells the subscriber to hang up
+                    continue
+                state.subscribers[q] = misses
+            else:
+                state.subscribers[q] = 0
+            q.put_nowait(item)
 
     def get(self, job_id: uuid.UUID) -> JobProgressState | None:
         return self._jobs.get(job_id)
@@ -159,39 +264,52 @@ class InMemoryProgressManager:
     def remove(self, job_id: uuid.UUID) -> None:
         self._jobs.pop(job_id, None)
 
-    async def subscribe(self, job_id: uuid.UUID) -> AsyncGenerator[str, None]:
+    async def subscribe(self, job_id: uuid.UUID) -> AsyncGenerator[bytes, None]:
         """Yield SSE-formatted progress events until job completes/fails."""
         state = self._jobs.get(job_id)
         if state is None:
-            yield self._format_event("progress", {"status": "unknown", "step": "Not found", "progress": 0})
+            yield _progress_event({"status": "unknown", "step": "Not found", "progress": 0})
             return
 
-        yield self._format_event("progress", {
-            "status": state.status,
-            "step": state.step,
-            "progress": state.progress,
-        })
+        # Join before reading the snapshot so no update can slip between the two
+        q: asyncio.Queue[tuple[str, bytes] | None] = asyncio.Queue(SUBSCRIBER_QUEUE_SIZE)
+        state.loop = asyncio.get_running_loop()
+        state.subscribers[q] = 0
 
-        while True:
-            state.event.clear()
-            try:
-                await asyncio.wait_for(state.event.wait(), timeout=30.0)
-            except asyncio.TimeoutError:
-                yield ": keepalive\n\n"
-                continue
-
-            yield self._format_event("progress", {
+        get = asyncio.create_task(q.get())
+        keepalive = asyncio.create_task(asyncio.sleep(KEEPALIVE_SECONDS))
+        try:
+            yield _progress_event({
                 "status": state.status,
                 "step": state.step,
                 "progress": state.progress,
             })
-
             if state.status in ("completed", "failed", "cancelled"):
-                break
+                return
 
-    @staticmethod
-    def _format_event(event_type: str, data: dict) -> str:
-        return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
+            while True:
+                done, _ = await asyncio.wait({get, keepalive}, return_when=asyncio.FIRST_COMPLETED)
+                if get not in done:
+                    yield KEEPALIVE_FRAME
+                    keepalive = asyncio.create_task(asyncio.sleep(KEEPALIVE_SECONDS))
+                    continue
+
+                item = get.result()
+                if item is None:
+                    logger.info("Dropping slow progress subscriber for job %s", job_id)
+                    break
+                get = asyncio.create_task(q.get())
+                keepalive.cancel()
+                keepalive = asyncio.create_task(asyncio.sleep(KEEPALIVE_SECONDS))
+
+                status, frame = item
+                yield frame
+                if status in ("completed", "failed", "cancelled"):
+                    break
+        finally:
+            get.cancel()
+            keepalive.cancel()
+            state.subscribers.pop(q, None)
 
 
 # ── Singleton factory ────────────────────────────────────────────────
@@ -1,45 +1,73 @@
 """Password hashing and JWT token management."""
 
+import time
 import uuid
-from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
+import bcrypt
 import jwt
-from passlib.context import CryptContext
 
 from backend.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Resolved once at import — settings don't change at runtime. Preparing the key
+# through the algorithm also rejects an unknown JWT_ALGORITHM at startup.
+_jwt = jwt.PyJWT()
+_JWT_KEY = jwt.get_algorithm_by_name(settings.JWT_ALGORITHM).prepare_key(settings.JWT_SECRET_KEY)
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+_JWT_DECODE_OPTIONS = {"require": ["exp", "sub", "type"]}
+# Lifetimes in seconds; exp is minted as a plain epoch int, not a datetime
+_ACCESS_TTL = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TTL = settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 86400
+
+
+# bcrypt only reads the first 72 bytes of a password (and bcrypt>=5 rejects
+# longer input), so truncate the encoded bytes as passlib used to
+BCRYPT_MAX_BYTES = 72
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password[:72])
+    return bcrypt.hashpw(password.encode()[:BCRYPT_MAX_BYTES], bcrypt.gensalt()).decode()
 
 
 def verify_password(plain: str, hashed: str) -> bool:
-    return pwd_context.verify(plain[:72], hashed)
+    return bcrypt.checkpw(plain.encode()[:BCRYPT_MAX_BYTES], hashed.encode())
 
 
 def create_access_token(user_id: uuid.UUID, email: str) -> str:
-    expire = datetime.now(timezone.utc) + timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
     payload = {
         "sub": str(user_id),
         "email": email,
-        "exp": expire,
+        "exp": int(time.time()) + _ACCESS_TTL,
         "type": "access",
     }
-    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    return _jwt.encode(payload, _JWT_KEY, algorithm=settings.JWT_ALGORITHM, sort_headers=False)
 
 
 def create_refresh_token(user_id: uuid.UUID) -> str:
-    expire = datetime.now(timezone.utc) + timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
     payload = {
         "sub": str(user_id),
-        "exp": expire,
+        "exp": int(time.time()) + _REFRESH_TTL,
         "type": "refresh",
     }
-    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    return _jwt.encode(payload, _JWT_KEY, algorithm=settings.JWT_ALGORITHM, sort_headers=False)
 
 
 def decode_token(token: str) -> dict:
     """Decode and validate a JWT token. Raises jwt.PyJWTError on failure."""
-    return jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+    return _jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS, options=_JWT_DECODE_OPTIONS)
+
+
+@lru_cache(maxsize=4096)
+def _decode_token_memo(token: str) -> dict:
+    return decode_token(token)
+
+
+def decode_token_cached(token: str) -> dict:
+    """
+    Like decode_token, but the signature check runs once per distinct token.
+    Expiry is re-checked on every call since cached payloads outlive `exp`.
+    """
+    payload = _decode_token_memo(token)
+    if payload["exp"] <= time.time():
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    return payload
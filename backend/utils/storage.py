@@ -1,11 +1,22 @@
 """File storage abstraction — local filesystem implementation."""
 
+import asyncio
+import errno
+import io
+import os
+import secrets
 import shutil
+import tempfile
 import uuid
+from functools import lru_cache
 from pathlib import Path
+from typing import BinaryIO
 
 from backend.config import settings
 
+# Chunk size for streaming copies into storage
+COPY_CHUNK_SIZE = 1024 * 1024
+
 
 class LocalStorage:
     """Stores files on local filesystem under STORAGE_LOCAL_PATH."""
@@ -18,16 +29,82 @@ class LocalStorage:
         return self.base / key
 
     async def store(self, local_path: Path, key: str) -> str:
-        dest = self._resolve(key)
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(str(local_path), str(dest))
+        await asyncio.to_thread(self._copy_file, local_path, self._resolve(key))
         return key
 
+    async def store_move(self, local_path: Path, key: str) -> str:
+        """Like store(), but hands the file over — local_path is gone afterwards."""
+        await asyncio.to_thread(self._move_file, local_path, self._resolve(key))
+        return key
+
+    @classmethod
+    def _move_file(cls, src: Path, dest: Path) -> None:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            # Same filesystem: a metadata-only rename, no data is touched
+            os.rename(src, dest)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            cls._copy_file(src, dest)
+            os.unlink(src)
+
+    @staticmethod
+    def _copy_file(src: Path, dest: Path) -> None:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if hasattr(os, "copy_file_range"):
+            try:
+                # In-kernel copy — a reflink on CoW filesystems, never via user space
+                with open(src, "rb") as fin, open(dest, "wb") as fout:
+                    while os.copy_file_range(fin.fileno(), fout.fileno(), COPY_CHUNK_SIZE * 64):
+                        pass
+                return
+            except OSError:
+                pass  # cross-device or unsupported: fall back below
+        # copyfile uses sendfile() on Linux
+        shutil.copyfile(src, dest)
+
     async def store_bytes(self, data: bytes, key: str) -> str:
-        dest = self._resolve(key)
+        await asyncio.to_thread(self._write_bytes, data, self._resolve(key))
+        return key
+
+    @staticmethod
+    def _write_bytes(data: bytes, dest: Path) -> None:
         dest.parent.mkdir(parents=True, exist_ok=True)
         dest.write_bytes(data)
-        return key
+
+    async def store_fileobj(self, src: BinaryIO, key: str, max_bytes: int | None = None) -> int:
+        """
+        Stream a file-like object into storage in fixed-size chunks.
+        Returns bytes written; raises ValueError (and removes the partial
+        file) if the stream exceeds max_bytes.
+        """
+        return await asyncio.to_thread(self._copy_fileobj, src, self._resolve(key), max_bytes)
+
+    @staticmethod
+    def _copy_fileobj(src: BinaryIO, dest: Path, max_bytes: int | None) -> int:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        written = 0
+        try:
+            with open(dest, "wb") as out:
+                src_fd = _disk_fileno(src)
+                if src_fd is not None:
+                    # Disk-backed source: let the kernel copy, bytes never enter Python
+                    offset = src.tell()
+                    while sent := os.sendfile(out.fileno(), src_fd, offset + written, COPY_CHUNK_SIZE):
+                        written += sent
+                        if max_bytes is not None and written > max_bytes:
+                            raise ValueError(f"Stream exceeds limit of {max_bytes} bytes")
+                else:
+                    while chunk := src.read(COPY_CHUNK_SIZE):
+                        written += len(chunk)
+                        if max_bytes is not None and written > max_bytes:
+                            raise ValueError(f"Stream exceeds limit of {max_bytes} bytes")
+                        out.write(chunk)
+        except BaseException:
+            dest.unlink(missing_ok=True)
+            raise
+        return written
 
     async def retrieve(self, key: str) -> Path:
         path = self._resolve(key)
@@ -36,18 +113,29 @@ class LocalStorage:
         return path
 
     async def delete(self, key: str) -> None:
-        path = self._resolve(key)
-        if path.exists():
-            path.unlink()
+        await asyncio.to_thread(self._resolve(key).unlink, missing_ok=True)
 
     async def get_url(self, key: str) -> str:
         return f"/media/{key}"
 
     def generate_key(self, user_id: uuid.UUID, folder: str, filename: str) -> str:
         ext = Path(filename).suffix
-        unique = uuid.uuid4().hex[:12]
+        # 72 random bits as 12 URL/filesystem-safe characters
+        unique = secrets.token_urlsafe(9)
         return f"{folder}/{user_id}/{unique}{ext}"
 
 
+def _disk_fileno(src: BinaryIO) -> int | None:
+    """Return src's OS file descriptor if it is backed by a real file, else None."""
+    # fileno() on an in-memory SpooledTemporaryFile would force it to disk first
+    if isinstance(src, tempfile.SpooledTemporaryFile) and not src._rolled:
+        return None
+    try:
+        return src.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+@lru_cache(maxsize=1)
 def get_storage() -> LocalStorage:
     return LocalStorage()
@@ -0,0 +1,39 @@
+"""
+Concurrency limits for video jobs.
+
+JOB_SEMAPHORE caps how many jobs a process runs at once, so a burst of
+submissions queues instead of spawning unbounded tasks. Inside a job the
+CPU-bound PDF parse and the GPU-bound encode get separate slot pools, so a
+long encode never holds up parsing for the next job (and vice versa), and
+the network-bound AI stages in between run ungated.
+"""
+
+import asyncio
+import functools
+import threading
+
+from backend.config import settings
+
+JOB_SEMAPHORE = asyncio.Semaphore(settings.MAX_CONCURRENT_JOBS)
+
+
+def _per_process(total: int) -> int:
+    """This process's share of a host-wide slot budget (at least one)."""
+    return max(1, total // max(1, settings.RUNNER_PROCESSES))
+
+
+# The pipeline runs in worker threads, so stage gates are threading semaphores.
+# GPU_SLOTS and PARSE_SLOTS are host-wide, split evenly across runner processes.
+PARSE_SLOTS = threading.BoundedSemaphore(_per_process(settings.PARSE_SLOTS))
+ENCODE_SLOTS = threading.BoundedSemaphore(_per_process(settings.GPU_SLOTS))
+
+
+def gated(fn, slots: threading.BoundedSemaphore):
+    """Wrap a blocking callable so each call holds one of `slots`."""
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with slots:
+            return fn(*args, **kwargs)
+
+    return wrapper
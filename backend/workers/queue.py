@@ -0,0 +1,82 @@
+"""
+Job dispatch for video generation.
+
+Uses a Redis list when available so jobs survive API restarts and are
+executed by separate runner processes (backend/workers/runner.py).
+Falls back to running jobs as in-process asyncio tasks when Redis is unavailable.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+
+from backend.workers.runner import QUEUE_KEY, execute_job
+
+logger = logging.getLogger(__name__)
+
+
+# ── Redis-backed implementation ──────────────────────────────────────
+
+class RedisJobQueue:
+    """Pushes job descriptors onto a Redis list consumed by the runner."""
+
+    def __init__(self, redis_url: str):
+        self._redis_url = redis_url
+        self._redis = None
+
+    async def _get_redis(self):
+        if self._redis is None:
+            import redis.asyncio as aioredis
+            self._redis = aioredis.from_url(self._redis_url, decode_responses=True)
+        return self._redis
+
+    async def enqueue(self, job_id: uuid.UUID, payload: dict) -> None:
+        r = await self._get_redis()
+        await r.lpush(QUEUE_KEY, json.dumps({"job_id": str(job_id), **payload}, default=str))
+
+
+# ── In-process fallback ──────────────────────────────────────────────
+
+class InProcessJobQueue:
+    """Runs jobs as asyncio tasks in the API process — single-process fallback."""
+
+    def __init__(self):
+        # Strong refs so running tasks aren't garbage-collected mid-render
+        self._tasks: set[asyncio.Task] = set()
+
+    async def enqueue(self, job_id: uuid.UUID, payload: dict) -> None:
+        # Round-trip through JSON so both backends hand execute_job the same shape
+        descriptor = json.loads(json.dumps({"job_id": str(job_id), **payload}, default=str))
+        task = asyncio.create_task(execute_job(descriptor))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+# ── Singleton factory ────────────────────────────────────────────────
+
+def _create_job_queue() -> RedisJobQueue | InProcessJobQueue:
+    """Try Redis first; fall back to in-process tasks if unavailable."""
+    from backend.config import settings
+
+    if settings.REDIS_URL:
+        try:
+            import redis as sync_redis
+            r = sync_redis.from_url(settings.REDIS_URL, decode_responses=True, socket_connect_timeout=2)
+            r.ping()
+            r.close()
+            logger.info("Job queue: using Redis at %s", settings.REDIS_URL)
+            return RedisJobQueue(settings.REDIS_URL)
+        except Exception as e:
+            logger.warning("Redis unavailable (%s), running jobs in-process", e)
+
+    logger.info("Job queue: using in-process fallback")
+    return InProcessJobQueue()
+
+
+job_queue = _create_job_queue()
+
+
+async def enqueue(job_id: uuid.UUID, payload: dict) -> None:
+    """Hand a job to whichever backend is active."""
+    await job_queue.enqueue(job_id, payload)
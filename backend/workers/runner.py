@@ -0,0 +1,241 @@
+"""
+Job runner — consumes queued video jobs from Redis and executes them.
+
+Run as a separate process next to the API:
+    python -m backend.workers.runner
+
+Each runner process starts MAX_CONCURRENT_JOBS consumer coroutines that
+BLMOVE from the shared queue, so throughput scales by adding runner processes —
+on other hosts, or on this one via RUNNER_PROCESSES, which makes the
+command supervise that many long-lived copies of itself and exit if any
+of them dies, so the container restarts and requeues its jobs.
+
+A job stays in this runner's processing list (keyed by RUNNER_ID) until it
+finishes; whatever is left there when the runner starts was interrupted by a
+crash or redeploy and is requeued. Runners on different hosts need distinct
+RUNNER_IDs so one never requeues another's in-flight jobs.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import multiprocessing.connection
+import sys
+import uuid
+from pathlib import Path
+
+from backend.config import settings
+from backend.db.session import async_session_factory, engine
+from backend.services.job_service import JobService
+from backend.services.video_service import VideoService
+from backend.utils.cache import response_cache
+from backend.utils.progress import progress_manager
+from backend.utils.storage import get_storage
+from backend.workers.pool import JOB_SEMAPHORE
+from backend.workers.video_worker import run_video_job, warm_imports
+
+logger = logging.getLogger(__name__)
+
+QUEUE_KEY = "pdf2video:jobs"
+# A job in any of these states was cancelled or finished while it sat queued
+_TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+# Descriptors being rendered by this runner. BLMOVE parks each job here until
+# it finishes, so a crash mid-render leaves it to be requeued on restart.
+PROCESSING_KEY = f"{QUEUE_KEY}:processing:{settings.RUNNER_ID}"
+
+
+async def execute_job(descriptor: dict) -> None:
+    """Render a queued job, then record the outcome in a short-lived session.
+
+    No DB session is held while the render runs, so pool usage scales with
+    jobs being finalized rather than jobs in flight.
+    """
+    job_id = uuid.UUID(descriptor["job_id"])
+    user_id = uuid.UUID(descriptor["user_id"])
+    pdf_path = descriptor.get("pdf_path")
+    music_path = descriptor.get("music_path")
+
+    # Publish state before waiting on the gate so SSE subscribers see the job
+    # as queued rather than unknown while it waits for a slot
+    progress_manager.update(job_id, "pending", "Queued", 0.0)
+
+    # Admission gate — a no-op for the Redis runner (one job per consumer), it
+    # bounds the in-process fallback where every enqueue spawns a task
+    async with JOB_SEMAPHORE:
+        try:
+            # The queue can hold a job for a while (and requeues after a crash),
+            # so confirm it's still wanted before paying for the pipeline
+            async with async_session_factory() as session:
+                status = await JobService(session).get_status(job_id)
+            if status is None or status in _TERMINAL_STATUSES:
+                logger.info("Skipping job %s: %s", job_id, status or "deleted")
+                return
+
+            attempts = descriptor.get("attempts", 0)
+            if attempts >= settings.MAX_JOB_ATTEMPTS:
+                async with async_session_factory() as session:
+                    await JobService(session).fail_job(
+                        job_id, f"Runner exited mid-render {attempts} times; giving up"
+                    )
+                    await session.commit()
+                return
+
+            try:
+                result_path = await run_video_job(
+                    job_id=job_id,
+                    user_id=user_id,
+                    source_type=descriptor["source_type"],
+                    title=descriptor["title"],
+                    job_settings=descriptor["job_settings"],
+                    pdf_path=Path(pdf_path) if pdf_path else None,
+                    image_paths=[Path(p) for p in descriptor.get("image_paths", [])],
+                    image_labels=descriptor.get("image_labels", []),
+                    music_path=Path(music_path) if music_path else None,
+                    text_content=descriptor.get("text_content"),
+                )
+                async with async_session_factory() as session:
+                    js = JobService(session)
+                    vs = VideoService(session, get_storage())
+                    video = await vs.create_video(
+                        user_id=user_id,
+                        title=descriptor["title"],
+                        local_path=result_path,
+                        resolution=descriptor["resolution"],
+                    )
+                    await js.set_video_id(job_id, video.id)
+                    await js.update_progress(job_id, "completed", "Complete!", 1.0)
+                    await session.commit()
+                await response_cache.invalidate("videos", user_id)
+            except Exception as e:
+                async with async_session_factory() as session:
+                    await JobService(session).fail_job(job_id, str(e))
+                    await session.commit()
+        finally:
+            progress_manager.remove(job_id)
+            await response_cache.invalidate("jobs", user_id)
+
+
+async def _consume(redis, worker_no: int) -> None:
+    """Pop and execute jobs forever — one job at a time per consumer."""
+    while True:
+        blob = await redis.blmove(QUEUE_KEY, PROCESSING_KEY, 0, "RIGHT", "LEFT")
+        try:
+            descriptor = json.loads(blob)
+        except ValueError:
+            logger.error("Worker %d: dropping malformed job descriptor %r", worker_no, blob[:200])
+        else:
+            logger.info("Worker %d: starting job %s", worker_no, descriptor.get("job_id"))
+            try:
+                await execute_job(descriptor)
+            except Exception:
+                # execute_job records failures itself; this only guards the loop
+                logger.exception("Worker %d: job %s crashed", worker_no, descriptor.get("job_id"))
+        # Skipped when shutdown cancels us mid-job, so the job stays parked
+        # and is requeued on the next start
+        await redis.lrem(PROCESSING_KEY, 1, blob)
+
+
+def requeue_orphaned_jobs() -> int:
+    """
+    Push jobs a previous run of this runner left mid-render back onto the queue.
+    Must run before any consumer starts, or it would requeue live jobs.
+    """
+    import redis as sync_redis
+
+    r = sync_redis.from_url(settings.REDIS_URL, decode_responses=True)
+    try:
+        requeued = 0
+        # Newest first, so the oldest orphan lands rightmost and runs first
+        while (blob := r.lindex(PROCESSING_KEY, 0)) is not None:
+            try:
+                descriptor = json.loads(blob)
+            except ValueError:
+                requeue = blob  # the consumer drops it
+            else:
+                # Counted so a job that keeps killing the runner is eventually failed
+                descriptor["attempts"] = descriptor.get("attempts", 0) + 1
+                requeue = json.dumps(descriptor)
+            # Move in one transaction so a crash here can't lose the job. Right
+            # end of the queue is popped next, so orphans go to the front.
+            with r.pipeline() as pipe:
+                pipe.lpop(PROCESSING_KEY)
+                pipe.rpush(QUEUE_KEY, requeue)
+                pipe.execute()
+            requeued += 1
+    finally:
+        r.close()
+    if requeued:
+        logger.warning("Requeued %d job(s) interrupted by a previous runner exit", requeued)
+    return requeued
+
+
+async def run_workers(concurrency: int | None = None) -> None:
+    """Start `concurrency` consumers against the Redis queue and run until cancelled."""
+    import redis.asyncio as aioredis
+
+    concurrency = concurrency or settings.MAX_CONCURRENT_JOBS
+    redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    # Pay the pipeline's import cost once, before any job is waiting on it
+    await asyncio.to_thread(warm_imports)
+    logger.info("Job runner: %d consumers on %s", concurrency, QUEUE_KEY)
+    try:
+        await asyncio.gather(*(_consume(redis, n) for n in range(concurrency)))
+    finally:
+        await redis.aclose()
+        await engine.dispose()
+
+
+def _serve() -> None:
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(run_workers())
+    except KeyboardInterrupt:
+        pass
+
+
+def main() -> None:
+    """Run one runner in this process, or supervise RUNNER_PROCESSES of them."""
+    logging.basicConfig(level=logging.INFO)
+    # Once, here, before any consumer in any child is running
+    requeue_orphaned_jobs()
+
+    if settings.RUNNER_PROCESSES <= 1:
+        _serve()
+        return
+
+    if settings.GPU_SLOTS < settings.RUNNER_PROCESSES:
+        # Every child keeps at least one encode slot, so the host total overshoots
+        logger.warning(
+            "GPU_SLOTS=%d is below RUNNER_PROCESSES=%d; up to %d concurrent encodes will run",
+            settings.GPU_SLOTS,
+            settings.RUNNER_PROCESSES,
+            settings.RUNNER_PROCESSES,
+        )
+
+    # Spawned, not forked: each child builds its own loop, DB pool and sockets
+    ctx = multiprocessing.get_context("spawn")
+    procs = [ctx.Process(target=_serve, name=f"runner-{n}") for n in range(settings.RUNNER_PROCESSES)]
+    for proc in procs:
+        proc.start()
+    try:
+        # Any child exiting (OOM kill, crash in a native decoder) takes the
+        # whole runner down rather than being respawned: its in-flight jobs sit
+        # in the shared processing list, which is only safe to requeue with no
+        # consumer running, i.e. on the restart this exit triggers.
+        dead = multiprocessing.connection.wait([proc.sentinel for proc in procs])
+        exited = next(proc for proc in procs if proc.sentinel in dead)
+        exited.join()  # reap it so exitcode is set
+        logger.error("%s exited with code %s; stopping the runner", exited.name, exited.exitcode)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass  # the children got the SIGINT too
+    finally:
+        for proc in procs:
+            if proc.is_alive():
+                proc.terminate()
+            proc.join()
+
+
+if __name__ == "__main__":
+    main()
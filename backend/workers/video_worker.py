@@ -4,8 +4,11 @@ Runs in a ThreadPoolExecutor to avoid blocking the async event loop.
 """
 
 import asyncio
+import re
+import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 
 from PIL import Image
@@ -14,12 +17,86 @@ from rich.console import Console
 from backend.config import settings
 from backend.utils.progress import progress_manager
 from backend.utils.storage import LocalStorage
+from backend.workers.pool import ENCODE_SLOTS, PARSE_SLOTS, gated
 
 console = Console()
 
 # Shared thread pool for CPU-bound pipeline work
 _executor = ThreadPoolExecutor(max_workers=settings.MAX_CONCURRENT_JOBS)
 
+# Pipeline step keywords (lowercase) -> frontend-compatible status codes
+_STEP_STATUSES = (
+    ("classifying images", "classifying"),
+    ("generating ai script", "scripting"),
+    ("generating ai voiceover", "voiceover"),
+    ("generating ai backgrounds", "backgrounds"),
+    ("composing video", "composing"),
+    ("exporting video", "exporting"),
+    ("planning slides", "scripting"),
+    ("generating slides", "composing"),
+    ("assembling pdf", "exporting"),
+    ("composing presentation", "composing"),
+)
+
+# Pipelines can report per frame; forward a tick only when it says something new
+PROGRESS_MIN_DELTA = 0.005
+PROGRESS_MIN_INTERVAL = 0.25
+
+# Threads per job for decoding uploaded images
+IMAGE_DECODE_THREADS = 8
+
+
+# One alternation over every keyword; group k<i> tells which entry matched.
+# Group names are positional because several keywords share a status.
+_STEP_STATUS_RE = re.compile(
+    "|".join(f"(?P<k{i}>{re.escape(keyword)})" for i, (keyword, _) in enumerate(_STEP_STATUSES)),
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=256)
+def _status_for_step(step: str) -> str:
+    m = _STEP_STATUS_RE.search(step)
+    return _STEP_STATUSES[int(m.lastgroup[1:])][1] if m else "composing"
+
+
+def warm_imports() -> None:
+    """Import the core/ pipeline modules ahead of the first job.
+
+    The pipeline still imports them lazily so the API process never loads
+    them, but a runner calls this at startup so jobs only hit sys.modules —
+    and concurrent first jobs don't queue on the import lock.
+    """
+    import core.config  # noqa: F401
+    import core.content_input  # noqa: F401
+    import core.pipeline  # noqa: F401
+    import core.presentation  # noqa: F401
+    import core.utils  # noqa: F401
+
+
+def _load_images(paths: list[Path], draft_size: tuple[int, int] | None = None) -> list[Image.Image]:
+    """Decode uploaded images in parallel, skipping any that fail to open.
+
+    PIL releases the GIL while decoding, so the threads overlap on separate
+    cores. With draft_size, JPEGs decode at the smallest DCT scale that still
+    covers it instead of at full resolution.
+    """
+    from core.utils import ensure_rgb
+
+    def load(path: Path) -> Image.Image | None:
+        try:
+            img = Image.open(path)
+            if draft_size:
+                img.draft("RGB", draft_size)
+            return ensure_rgb(img)
+        except Exception:
+            return None
+
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(IMAGE_DECODE_THREADS, len(paths))) as pool:
+        return [img for img in pool.map(load, paths) if img is not None]
+
 
 def _run_pipeline_sync(
     job_id: uuid.UUID,
@@ -53,41 +130,32 @@ def _run_pipeline_sync(
     Config.VIDEO_FPS = fps
     Config.ensure_dirs()
 
-    # Map pipeline status strings to frontend-compatible status codes
-    step_to_status = {
-        "Classifying images": "classifying",
-        "Generating AI script": "scripting",
-        "Generating AI voiceover": "voiceover",
-        "Generating AI backgrounds": "backgrounds",
-        "Composing video": "composing",
-        "Exporting video": "exporting",
-        "Planning slides": "scripting",
-        "Generating slides": "composing",
-        "Assembling PDF": "exporting",
-        "Composing presentation": "composing",
-    }
+    # Last tick forwarded to the progress manager
+    last = {"step": "", "pct": -1.0, "ts": 0.0}
 
     def on_progress(step: str, pct: float):
-        status = "composing"
-        for keyword, s in step_to_status.items():
-            if keyword.lower() in step.lower():
-                status = s
-                break
-        progress_manager.update(job_id, status, step, pct)
+        now = time.monotonic()
+        if (
+            step == last["step"]
+            and pct - last["pct"] < PROGRESS_MIN_DELTA
+            and now - last["ts"] < PROGRESS_MIN_INTERVAL
+        ):
+            return
+        last.update(step=step, pct=pct, ts=now)
+        progress_manager.update(job_id, _status_for_step(step), step, pct)
 
     # ── Presentation Mode ─────────────────────────────────
     if output_mode in ("presentation", "both"):
         from core.presentation import PresentationPipeline
 
-        # Load uploaded images (first one treated as logo for branding)
-        pil_images = []
-        for p in image_paths:
-            try:
-                pil_images.append(Image.open(p).convert("RGB"))
-            except Exception:
-                pass
+        # Load uploaded images (first one treated as logo for branding).
+        # Full resolution — slides also go into the exported PDF.
+        pil_images = _load_images(image_paths)
 
         pres_pipeline = PresentationPipeline()
+        # Per-instance stage gates — see backend/workers/pool.py
+        pres_pipeline.extractor.extract = gated(pres_pipeline.extractor.extract, PARSE_SLOTS)
+        pres_pipeline.generator.export_video = gated(pres_pipeline.generator.export_video, ENCODE_SLOTS)
         result = pres_pipeline.run(
             pdf_path=pdf_path,
             text_content=text_content,
@@ -108,6 +176,8 @@ def _run_pipeline_sync(
     from core.pipeline import PDF2VideoPipeline
 
     pipeline = PDF2VideoPipeline()
+    pipeline.extractor.extract = gated(pipeline.extractor.extract, PARSE_SLOTS)
+    pipeline.composer.compose = gated(pipeline.composer.compose, ENCODE_SLOTS)
     output_path = output_dir / f"{job_id}.mp4"
 
     if source_type == "pdf" and pdf_path:
@@ -121,12 +191,7 @@ def _run_pipeline_sync(
         )
     else:
         # Text + images workflow
-        pil_images = []
-        for p in image_paths:
-            try:
-                pil_images.append(Image.open(p).convert("RGB"))
-            except Exception:
-                pass
+        pil_images = _load_images(image_paths, draft_size=Config.VIDEO_SIZE)
 
         content = content_from_text_and_images(
             title=title,
@@ -167,26 +232,25 @@ async def run_video_job(
     output_dir = settings.STORAGE_LOCAL_PATH / "temp" / str(job_id)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    progress_manager.register(job_id)
+    # update() creates the job's state on first sight — no separate register()
     progress_manager.update(job_id, "pending", "Starting...", 0.0)
 
-    loop = asyncio.get_event_loop()
+    run = partial(
+        _run_pipeline_sync,
+        job_id,
+        source_type,
+        title,
+        job_settings,
+        pdf_path,
+        image_paths,
+        image_labels,
+        music_path,
+        text_content,
+        output_dir,
+    )
 
     try:
-        result_path = await loop.run_in_executor(
-            _executor,
-            _run_pipeline_sync,
-            job_id,
-            source_type,
-            title,
-            job_settings,
-            pdf_path,
-            image_paths,
-            image_labels,
-            music_path,
-            text_content,
-            output_dir,
-        )
+        result_path = await asyncio.get_running_loop().run_in_executor(_executor, run)
         progress_manager.update(job_id, "completed", "Complete!", 1.0)
         return result_path
 
@@ -3,7 +3,6 @@ AI Services — OpenAI integration for script writing, voiceover, and image gene
 Uses the Responses API with structured output and gpt-image-1.
 """
 
-import base64
 import io
 import json
 import time
@@ -11,17 +10,20 @@ import tempfile
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from dataclasses import dataclass, field
-from openai import OpenAI, APITimeoutError, APIConnectionError, RateLimitError
+from openai import APITimeoutError, APIConnectionError, RateLimitError
 from PIL import Image
 from rich.console import Console
 
+from . import llm_cache, rate_limit
 from .config import Config
 from .content_input import ContentInput, ContentImage
 from .pdf_extractor import PDFContent
-from .utils import retry_api as _retry, image_to_data_url
+from .utils import retry_api as _retry, image_to_data_url, images_to_data_urls, openai_client, write_b64_file
 
 console = Console()
 
+SCRIPT_TEMPERATURE = 0.7
+
 
 # ── JSON Schema for Structured Output ────────────────────
 
@@ -78,66 +80,22 @@ VIDEO_SCRIPT_SCHEMA = {
     },
 }
 
+# Passed by reference to every script request
+_VIDEO_SCRIPT_FORMAT = {"format": VIDEO_SCRIPT_SCHEMA}
 
-@dataclass
-class SceneScript:
-    """Script for a single video scene."""
-    scene_number: int
-    narration: str
-    visual_description: str
-    mood: str  # e.g., "professional", "inspiring", "dramatic"
-    source_pages: list[int] = field(default_factory=list)
-    duration_hint: float = 8.0  # suggested duration in seconds
-    generate_background: bool = False  # whether to AI-generate a background
-    background_prompt: str = ""
-    use_uploaded_images: list[int] = field(default_factory=list)  # indices into ContentInput.all_images
-    layout_mode: str = "single"  # single, carousel, split_screen, picture_in_picture
-
-
-@dataclass
-class VideoScript:
-    """Complete video script with all scenes."""
-    title: str
-    scenes: list[SceneScript]
-    total_narration: str = ""  # combined narration for single TTS pass
-    intro_text: str = ""
-    outro_text: str = ""
-    overall_mood: str = "professional"
-
-
-class AIServices:
-    """OpenAI-powered AI services for video generation pipeline."""
-
-    def __init__(self):
-        Config.validate()
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
-
-    # ── Script Generation ───────────────────────────────────
-
-    def generate_script(self, pdf_content: PDFContent) -> VideoScript:
-        """Generate a cinematic video script from PDF content using Responses API."""
-        console.print("[bold blue]🎬 Generating video script with AI...[/]")
 
-        # Build content summary for the AI
-        pages_summary = []
-        for page in pdf_content.pages:
-            page_info = {
-                "page": page.page_number,
-                "text": page.text[:2000],  # cap per page
-                "has_images": page.has_significant_images,
-                "has_text": page.has_significant_text,
-            }
-            pages_summary.append(page_info)
+# ── Prompt Templates ─────────────────────────────────────
+# Built once at import; str.format fills in the per-document parts.
 
-        prompt = f"""You are a professional video scriptwriter. Convert this PDF content into a 
+_SCRIPT_PROMPT_TMPL = """You are a professional video scriptwriter. Convert this PDF content into a 
 cinematic video script. The video should feel like a polished documentary or explainer video — 
 NOT a slideshow or presentation.
 
-PDF Title: {pdf_content.title}
-Total Pages: {pdf_content.total_pages}
+PDF Title: {title}
+Total Pages: {total_pages}
 
 Page Contents:
-{json.dumps(pages_summary, indent=2)}
+{pages_summary}
 
 Create a video script as JSON with this exact structure:
 {{
@@ -183,15 +141,117 @@ Guidelines:
 
 Return ONLY valid JSON, no markdown formatting."""
 
-        response = _retry(lambda: self.client.responses.create(
-            model=Config.OPENAI_CHAT_MODEL,
-            input=[{"role": "user", "content": prompt}],
-            text={"format": VIDEO_SCRIPT_SCHEMA},
-            temperature=0.7,
-        ))
+_SCRIPT_FROM_CONTENT_PROMPT_TMPL = """You are a professional video scriptwriter. Convert this content into a 
+cinematic video script. The video should feel like a polished documentary or explainer video.
+
+Title: {title}
+Source type: {source_type}
+Total sections: {total_sections}
+Total images available: {image_count}
+
+Section Contents:
+{sections_summary}
+
+Available Images (by index, with AI classification):
+{image_inventory}
+
+I am also sending you thumbnail previews of each available image so you can SEE what they contain.
+
+Create a video script as JSON. For each scene:
+- **use_uploaded_images**: list the 0-based indices of images that should appear in that scene.
+  Use EVERY uploaded image at least once (EXCEPT logos — logos are used as watermarks, not scene visuals).
+  Assign images to the scenes where they are most relevant.
+- **generate_background**: set true ONLY for scenes that have NO suitable uploaded images.
+  If a scene already has good uploaded images, set this to false.
+  Also set true for picture_in_picture scenes (the AI background is the full-frame backdrop).
+- **source_pages**: section numbers this scene draws content from.
+- **layout_mode**: choose the best visual composition for each scene:
+  - "single" — one primary image with Ken Burns (best for photos, simple scenes)
+  - "carousel" — cycle through multiple images with crossfades (best when a scene references 3+ images)
+  - "split_screen" — side-by-side comparison layout (best for before/after, two charts, comparison images)
+  - "picture_in_picture" — AI background full-frame with a figure/chart inset in a rounded corner card (best when you have a data visual like a chart or diagram AND want an atmospheric backdrop)
+
+Layout selection rules:
+- If a scene has only 1 non-logo image → "single"
+- If a scene has 2 comparison images (is_comparison=true) → "split_screen"
+- If a scene has 3+ images → "carousel"
+- If a scene has a chart/diagram AND generate_background=true → "picture_in_picture"
+- Photos classified as "photo" look best as "single" with full-bleed Ken Burns
+- Tables classified as "table" are rendered as styled cards automatically regardless of layout
+- Images classified as "logo" should NOT be in use_uploaded_images — they are auto-applied as watermarks
+
+Guidelines:
+- Combine related sections into single scenes (aim for 4-10 scenes total)
+- Write narration that's conversational and engaging, 2-4 sentences per scene
+- Reference the images in your narration when relevant (e.g., "As we can see here...")
+- For scenes with strong uploaded images, let the visuals breathe — shorter narration
+- Charts/diagrams need longer duration (use suggested_hold_seconds from classification)
+- Only generate_background=true when a scene truly lacks visual content OR uses picture_in_picture
+- Duration hints: 5-8s for simple scenes, 8-15s for complex or multi-image scenes
+- The video should have narrative flow — one cohesive story
+
+Return ONLY valid JSON, no markdown formatting."""
+
+@dataclass
+class SceneScript:
+    """Script for a single video scene."""
+    scene_number: int
+    narration: str
+    visual_description: str
+    mood: str  # e.g., "professional", "inspiring", "dramatic"
+    source_pages: list[int] = field(default_factory=list)
+    duration_hint: float = 8.0  # suggested duration in seconds
+    generate_background: bool = False  # whether to AI-generate a background
+    background_prompt: str = ""
+    use_uploaded_images: list[int] = field(default_factory=list)  # indices into ContentInput.all_images
+    layout_mode: str = "single"  # single, carousel, split_screen, picture_in_picture
+
+
+@dataclass
+class VideoScript:
+    """Complete video script with all scenes."""
+    title: str
+    scenes: list[SceneScript]
+    total_narration: str = ""  # combined narration for single TTS pass
+    intro_text: str = ""
+    outro_text: str = ""
+    overall_mood: str = "professional"
+
+
+class AIServices:
+    """OpenAI-powered AI services for video generation pipeline."""
+
+    def __init__(self):
+        Config.validate()
+        self.client = openai_client(Config.OPENAI_API_KEY)
+
+    # ── Script Generation ───────────────────────────────────
+
+    def generate_script(self, pdf_content: PDFContent) -> VideoScript:
+        """Generate a cinematic video script from PDF content using Responses API."""
+        console.print("[bold blue]🎬 Generating video script with AI...[/]")
+
+        # Build content summary for the AI
+        pages_summary = []
+        for page in pdf_content.pages:
+            page_info = {
+                "page": page.page_number,
+                "text": page.text[:2000],  # cap per page
+                "has_images": page.has_significant_images,
+                "has_text": page.has_significant_text,
+            }
+            pages_summary.append(page_info)
+
+        prompt = _SCRIPT_PROMPT_TMPL.format(
+            title=pdf_content.title,
+            total_pages=pdf_content.total_pages,
+            pages_summary=json.dumps(pages_summary, indent=2),
+        )
+
+        output_text = self._script_output_text([{"role": "user", "content": prompt}])
 
         # Structured output guarantees valid JSON matching our schema
-        script_data = json.loads(response.output_text)
+        script_data = json.loads(output_text)
 
         scenes = []
         for s in script_data["scenes"]:
@@ -263,79 +323,32 @@ Return ONLY valid JSON, no markdown formatting."""
                 entry["suggested_hold_seconds"] = ci.suggested_hold_seconds
             image_inventory.append(entry)
 
-        prompt_text = f"""You are a professional video scriptwriter. Convert this content into a 
-cinematic video script. The video should feel like a polished documentary or explainer video.
-
-Title: {content.title}
-Source type: {content.source_type}
-Total sections: {content.total_sections}
-Total images available: {content.image_count}
-
-Section Contents:
-{json.dumps(sections_summary, indent=2)}
-
-Available Images (by index, with AI classification):
-{json.dumps(image_inventory, indent=2)}
-
-I am also sending you thumbnail previews of each available image so you can SEE what they contain.
-
-Create a video script as JSON. For each scene:
-- **use_uploaded_images**: list the 0-based indices of images that should appear in that scene.
-  Use EVERY uploaded image at least once (EXCEPT logos — logos are used as watermarks, not scene visuals).
-  Assign images to the scenes where they are most relevant.
-- **generate_background**: set true ONLY for scenes that have NO suitable uploaded images.
-  If a scene already has good uploaded images, set this to false.
-  Also set true for picture_in_picture scenes (the AI background is the full-frame backdrop).
-- **source_pages**: section numbers this scene draws content from.
-- **layout_mode**: choose the best visual composition for each scene:
-  - "single" — one primary image with Ken Burns (best for photos, simple scenes)
-  - "carousel" — cycle through multiple images with crossfades (best when a scene references 3+ images)
-  - "split_screen" — side-by-side comparison layout (best for before/after, two charts, comparison images)
-  - "picture_in_picture" — AI background full-frame with a figure/chart inset in a rounded corner card (best when you have a data visual like a chart or diagram AND want an atmospheric backdrop)
-
-Layout selection rules:
-- If a scene has only 1 non-logo image → "single"
-- If a scene has 2 comparison images (is_comparison=true) → "split_screen"
-- If a scene has 3+ images → "carousel"
-- If a scene has a chart/diagram AND generate_background=true → "picture_in_picture"
-- Photos classified as "photo" look best as "single" with full-bleed Ken Burns
-- Tables classified as "table" are rendered as styled cards automatically regardless of layout
-- Images classified as "logo" should NOT be in use_uploaded_images — they are auto-applied as watermarks
-
-Guidelines:
-- Combine related sections into single scenes (aim for 4-10 scenes total)
-- Write narration that's conversational and engaging, 2-4 sentences per scene
-- Reference the images in your narration when relevant (e.g., "As we can see here...")
-- For scenes with strong uploaded images, let the visuals breathe — shorter narration
-- Charts/diagrams need longer duration (use suggested_hold_seconds from classification)
-- Only generate_background=true when a scene truly lacks visual content OR uses picture_in_picture
-- Duration hints: 5-8s for simple scenes, 8-15s for complex or multi-image scenes
-- The video should have narrative flow — one cohesive story
-
-Return ONLY valid JSON, no markdown formatting."""
+        prompt_text = _SCRIPT_FROM_CONTENT_PROMPT_TMPL.format(
+            title=content.title,
+            source_type=content.source_type,
+            total_sections=content.total_sections,
+            image_count=content.image_count,
+            sections_summary=json.dumps(sections_summary, indent=2),
+            image_inventory=json.dumps(image_inventory, indent=2),
+        )
 
         # Build the multimodal input: text prompt + image thumbnails
         input_content = [{"type": "input_text", "text": prompt_text}]
 
-        # Attach image thumbnails (resized to save tokens)
-        for i, ci in enumerate(content.all_images):
-            try:
-                data_url = self._image_to_data_url(ci.image, max_size=512)
-                input_content.append({
-                    "type": "input_image",
-                    "image_url": data_url,
-                })
-            except Exception as e:
-                console.print(f"  [yellow]⚠ Could not encode image {i}: {e}[/]")
+        # Attach image thumbnails (resized to save tokens), encoded in parallel
+        thumbnails = images_to_data_urls([ci.image for ci in content.all_images], max_size=512)
+        for i, data_url in enumerate(thumbnails):
+            if isinstance(data_url, Exception):
+                console.print(f"  [yellow]⚠ Could not encode image {i}: {data_url}[/]")
+                continue
+            input_content.append({
+                "type": "input_image",
+                "image_url": data_url,
+            })
 
-        response = _retry(lambda: self.client.responses.create(
-            model=Config.OPENAI_CHAT_MODEL,
-            input=[{"role": "user", "content": input_content}],
-            text={"format": VIDEO_SCRIPT_SCHEMA},
-            temperature=0.7,
-        ))
+        output_text = self._script_output_text([{"role": "user", "content": input_content}])
 
-        script_data = json.loads(response.output_text)
+        script_data = json.loads(output_text)
 
         scenes = []
         for s in script_data["scenes"]:
@@ -382,6 +395,23 @@ Return ONLY valid JSON, no markdown formatting."""
 
         return video_script
 
+    def _script_output_text(self, input_messages: list) -> str:
+        """Run a script-generation request, reusing a cached reply for identical input."""
+        key = llm_cache.cache_key(Config.OPENAI_CHAT_MODEL, input_messages, VIDEO_SCRIPT_SCHEMA, SCRIPT_TEMPERATURE)
+        cached = llm_cache.load(key)
+        if cached is not None:
+            console.print("  [dim]Using cached script for identical input[/]")
+            return cached
+
+        response = _retry(lambda: self.client.responses.create(
+            model=Config.OPENAI_CHAT_MODEL,
+            input=input_messages,
+            text=_VIDEO_SCRIPT_FORMAT,
+            temperature=SCRIPT_TEMPERATURE,
+        ), bucket=rate_limit.RESPONSES)
+        llm_cache.store(key, response.output_text)
+        return response.output_text
+
     # ── Image Encoding Helper ────────────────────────────────
 
     @staticmethod
@@ -403,18 +433,24 @@ Return ONLY valid JSON, no markdown formatting."""
         audio_paths: list[Path | None] = [None] * len(script.scenes)
 
         def _generate_one(idx: int, scene: SceneScript) -> tuple[int, Path]:
-            audio_path = output_dir / f"scene_{scene.scene_number:03d}_voice.mp3"
-            response = _retry(lambda: self.client.audio.speech.create(
-                model=Config.OPENAI_TTS_MODEL,
-                voice=selected_voice,
-                input=scene.narration,
-                response_format="mp3",
-                speed=0.95,
-            ))
-            response.stream_to_file(str(audio_path))
+            audio_path = output_dir / f"scene_{scene.scene_number:03d}_voice.{Config.OPENAI_TTS_FORMAT}"
+
+            def _download():
+                # Streamed: audio lands on disk as it arrives, never held whole in memory
+                with self.client.audio.speech.with_streaming_response.create(
+                    model=Config.OPENAI_TTS_MODEL,
+                    voice=selected_voice,
+                    input=scene.narration,
+                    response_format=Config.OPENAI_TTS_FORMAT,
+                    speed=0.95,
+                ) as response:
+                    response.stream_to_file(audio_path)
+
+            _retry(_download, bucket=rate_limit.TTS)
             return idx, audio_path
 
-        max_workers = min(8, len(script.scenes))
+        # The HTTP calls overlap on threads; the pipeline itself is synchronous
+        max_workers = max(1, min(Config.TTS_CONCURRENCY, len(script.scenes)))
         with ThreadPoolExecutor(max_workers=max_workers) as pool:
             futures = {
                 pool.submit(_generate_one, i, scene): i
@@ -430,29 +466,31 @@ Return ONLY valid JSON, no markdown formatting."""
 
     # ── Background Image Generation ─────────────────────────
 
+    @staticmethod
+    def _background_request(prompt: str) -> dict:
+        """images.generate parameters for a scene background — shared by the sync and batch paths."""
+        return {
+            "model": Config.OPENAI_IMAGE_MODEL,
+            "prompt": (
+                f"Cinematic, high-quality, 16:9 aspect ratio, atmospheric background. "
+                f"No text or words in the image. Subtle depth of field. "
+                f"{prompt}"
+            ),
+            "size": "1536x1024",
+            "quality": "high",
+            "n": 1,
+        }
+
     def generate_background_image(self, prompt: str, output_path: Path) -> Path:
         """Generate a cinematic background image using gpt-image-1."""
         console.print(f"  🎨 Generating background: {prompt[:60]}...")
 
-        enhanced_prompt = (
-            f"Cinematic, high-quality, 16:9 aspect ratio, atmospheric background. "
-            f"No text or words in the image. Subtle depth of field. "
-            f"{prompt}"
-        )
-
-        response = _retry(lambda: self.client.images.generate(
-            model=Config.OPENAI_IMAGE_MODEL,
-            prompt=enhanced_prompt,
-            size="1536x1024",
-            quality="high",
-            n=1,
-        ))
-
-        # gpt-image-1 returns base64 data directly
-        img_b64 = response.data[0].b64_json
-        output_path.write_bytes(base64.b64decode(img_b64))
+        request = self._background_request(prompt)
+        response = _retry(lambda: self.client.images.generate(**request), bucket=rate_limit.IMAGES)
 
-        return output_path
+        # gpt-image-1 returns base64 data directly; decode it to disk in
+        # chunks so concurrent generations don't each hold the full PNG too
+        return write_b64_file(response.data[0].b64_json, output_path)
 
     def generate_scene_backgrounds(
         self, script: VideoScript, output_dir: Path
@@ -464,6 +502,12 @@ Return ONLY valid JSON, no markdown formatting."""
         if not scenes_needing_bg:
             return {}
 
+        if Config.USE_BATCH_API:
+            try:
+                return self._generate_backgrounds_batch(scenes_needing_bg, output_dir)
+            except Exception as e:
+                console.print(f"  [yellow]⚠ Batch background generation failed ({e}), generating directly[/]")
+
         console.print(f"[bold blue]🎨 Generating {len(scenes_needing_bg)} AI backgrounds (parallel)...[/]")
         backgrounds = {}
 
@@ -476,7 +520,7 @@ Return ONLY valid JSON, no markdown formatting."""
                 console.print(f"  [yellow]⚠ Background gen failed for scene {scene.scene_number}: {e}[/]")
                 return scene.scene_number, None
 
-        max_workers = min(4, len(scenes_needing_bg))
+        max_workers = max(1, min(Config.IMAGE_CONCURRENCY, len(scenes_needing_bg)))
         with ThreadPoolExecutor(max_workers=max_workers) as pool:
             futures = [pool.submit(_generate_one, s) for s in scenes_needing_bg]
             for future in as_completed(futures):
@@ -488,6 +532,72 @@ Return ONLY valid JSON, no markdown formatting."""
         console.print(f"[bold green]✓[/] Generated {len(backgrounds)} backgrounds")
         return backgrounds
 
+    def _generate_backgrounds_batch(
+        self, scenes: list[SceneScript], output_dir: Path
+    ) -> dict[int, Path]:
+        """
+        Generate backgrounds through the Batch API — half the price of direct
+        calls and outside the synchronous image RPM, at the cost of waiting
+        for the batch. Raises if the batch as a whole doesn't complete.
+        """
+        console.print(f"[bold blue]🎨 Submitting {len(scenes)} AI backgrounds as a batch...[/]")
+        lines = [
+            json.dumps({
+                "custom_id": f"scene_{s.scene_number}",
+                "method": "POST",
+                "url": "/v1/images/generations",
+                "body": self._background_request(s.background_prompt),
+            })
+            for s in scenes
+        ]
+        batch_file = self.client.files.create(
+            file=("backgrounds.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/images/generations",
+            completion_window="24h",
+        )
+
+        # Poll with exponential backoff until the batch settles or we give up
+        deadline = time.monotonic() + Config.BATCH_MAX_WAIT_SECONDS
+        delay = 5.0
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() + delay > deadline:
+                self.client.batches.cancel(batch.id)
+                raise TimeoutError(f"batch {batch.id} still {batch.status} after {Config.BATCH_MAX_WAIT_SECONDS}s")
+            time.sleep(delay)
+            delay = min(delay * 2, 60.0)
+            batch = self.client.batches.retrieve(batch.id)
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"batch {batch.id} ended as {batch.status}")
+
+        backgrounds = {}
+        answered = set()
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            scene_num = int(result["custom_id"].removeprefix("scene_"))
+            answered.add(scene_num)
+            response = result.get("response") or {}
+            if response.get("status_code") != 200:
+                error = result.get("error") or response.get("body", {}).get("error")
+                console.print(f"  [yellow]⚠ Background gen failed for scene {scene_num}: {error}[/]")
+                continue
+            bg_path = output_dir / f"scene_{scene_num:03d}_bg.png"
+            backgrounds[scene_num] = write_b64_file(response["body"]["data"][0]["b64_json"], bg_path)
+            console.print(f"  Scene {scene_num}: background ready")
+
+        # Requests that errored before producing a response only appear in the error file
+        for s in scenes:
+            if s.scene_number not in answered:
+                console.print(f"  [yellow]⚠ No batch background for scene {s.scene_number}[/]")
+
+        console.print(f"[bold green]✓[/] Generated {len(backgrounds)} backgrounds")
+        return backgrounds
+
     # ── Narration Timing Analysis ───────────────────────────
 
     def estimate_narration_duration(self, text: str) -> float:
@@ -23,7 +23,25 @@ class Config:
     OPENAI_CHAT_MODEL: str = os.getenv("OPENAI_CHAT_MODEL", "gpt-5.2")
     OPENAI_TTS_MODEL: str = os.getenv("OPENAI_TTS_MODEL", "tts-1")
     OPENAI_TTS_VOICE: str = os.getenv("OPENAI_TTS_VOICE", "onyx")
+    # Voiceover container, also used as the file extension. wav skips the MP3
+    # encode on OpenAI's side and the decode when clips are mixed; the raw
+    # "pcm" format has no header and can't be read back, so it isn't supported.
+    OPENAI_TTS_FORMAT: str = os.getenv("OPENAI_TTS_FORMAT", "wav")
     OPENAI_IMAGE_MODEL: str = os.getenv("OPENAI_IMAGE_MODEL", "gpt-image-1")
+    # Voiceover clips requested at once per job — bounded by the account's TTS RPM
+    TTS_CONCURRENCY: int = int(os.getenv("TTS_CONCURRENCY", "8"))
+    # Image generations requested at once per job — each takes 10-30 s, bounded by image RPM
+    IMAGE_CONCURRENCY: int = int(os.getenv("IMAGE_CONCURRENCY", "4"))
+    # Generate scene backgrounds through the Batch API: half price and no
+    # image RPM pressure, but the job waits for the batch (up to the limit below)
+    USE_BATCH_API: bool = _env_bool("USE_BATCH_API", False)
+    BATCH_MAX_WAIT_SECONDS: int = int(os.getenv("BATCH_MAX_WAIT_SECONDS", "3600"))
+    # Requests per minute to pace each endpoint to (per process); 0 = unpaced
+    OPENAI_RESPONSES_RPM: int = int(os.getenv("OPENAI_RESPONSES_RPM", "0"))
+    OPENAI_TTS_RPM: int = int(os.getenv("OPENAI_TTS_RPM", "0"))
+    OPENAI_IMAGES_RPM: int = int(os.getenv("OPENAI_IMAGES_RPM", "0"))
+    # Seconds a cached script reply stays valid for identical input; 0 disables the cache
+    LLM_CACHE_TTL_SECONDS: int = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
 
     # ── Video Output ────────────────────────────────────────
     VIDEO_WIDTH: int = int(os.getenv("VIDEO_WIDTH", "1280"))
@@ -67,6 +85,8 @@ class Config:
     # ── GPU / Performance ───────────────────────────────────
     # NVENC presets: p1(fastest) → p7(slowest/best quality)
     NVENC_PRESET: str = "p4"
+    # Frames NVENC may buffer before emitting output — hides per-frame submit latency
+    NVENC_DELAY: int = int(os.getenv("NVENC_DELAY", "4"))
     AUTO_TUNE_WORKERS: bool = _env_bool("AUTO_TUNE_WORKERS", True)
     # Number of threads for CPU-heavy render work.
     # Override with NUM_WORKERS env var when needed.
@@ -9,6 +9,8 @@ from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional
 
+from .utils import ensure_rgb
+
 
 @dataclass
 class ContentImage:
@@ -99,7 +101,7 @@ def content_from_pdf(pdf_content) -> ContentInput:
         # Wrap extracted images
         for i, img in enumerate(page.images):
             ci = ContentImage(
-                image=img.convert("RGB"),
+                image=ensure_rgb(img),
                 label=f"Page {page.page_number} image {i + 1}",
                 source=f"pdf_extracted_page_{page.page_number}",
             )
@@ -109,7 +111,7 @@ def content_from_pdf(pdf_content) -> ContentInput:
         # Wrap page render
         if page.page_render:
             ci = ContentImage(
-                image=page.page_render.convert("RGB"),
+                image=ensure_rgb(page.page_render),
                 label=f"Page {page.page_number} render",
                 source=f"pdf_page_{page.page_number}",
             )
@@ -153,7 +155,7 @@ def content_from_text_and_images(
     for i, img in enumerate(images):
         label = image_labels[i] if i < len(image_labels) else f"Image {i + 1}"
         ci = ContentImage(
-            image=img.convert("RGB"),
+            image=ensure_rgb(img),
             label=label,
             source="uploaded",
         )
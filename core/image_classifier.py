@@ -10,11 +10,12 @@ import json
 import time
 from dataclasses import dataclass
 from PIL import Image
-from openai import OpenAI, APITimeoutError, APIConnectionError, RateLimitError
+from openai import APITimeoutError, APIConnectionError, RateLimitError
 from rich.console import Console
 
+from . import rate_limit
 from .config import Config
-from .utils import retry_api, image_to_data_url
+from .utils import retry_api, image_to_data_url, images_to_data_urls, openai_client
 
 console = Console()
 
@@ -121,7 +122,7 @@ class ImageClassifier:
 
     def __init__(self):
         Config.validate()
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
+        self.client = openai_client(Config.OPENAI_API_KEY)
 
     def classify_images(self, images: list) -> list[ImageClassification]:
         """
@@ -181,17 +182,18 @@ class ImageClassifier:
             ),
         }]
 
-        # Attach image thumbnails
-        for i, ci in enumerate(images):
-            try:
-                img = ci.image if hasattr(ci, 'image') else ci
-                data_url = self._image_to_data_url(img, max_size=512)
-                input_content.append({
-                    "type": "input_image",
-                    "image_url": data_url,
-                })
-            except Exception as e:
-                console.print(f"  [yellow]⚠ Could not encode image {offset + i}: {e}[/]")
+        # Attach image thumbnails, encoded in parallel
+        thumbnails = images_to_data_urls(
+            [ci.image if hasattr(ci, 'image') else ci for ci in images], max_size=512
+        )
+        for i, data_url in enumerate(thumbnails):
+            if isinstance(data_url, Exception):
+                console.print(f"  [yellow]⚠ Could not encode image {offset + i}: {data_url}[/]")
+                continue
+            input_content.append({
+                "type": "input_image",
+                "image_url": data_url,
+            })
 
         try:
             response = retry_api(lambda: self.client.responses.create(
@@ -199,7 +201,7 @@ class ImageClassifier:
                 input=[{"role": "user", "content": input_content}],
                 text={"format": BATCH_CLASSIFICATION_SCHEMA},
                 temperature=0.3,
-            ))
+            ), bucket=rate_limit.RESPONSES)
 
             data = json.loads(response.output_text)
             results = []
@@ -0,0 +1,61 @@
+"""
+On-disk cache for Responses API text output.
+
+Entries are keyed by a SHA-256 of everything that shapes the reply (model,
+input — including any base64 image thumbnails — output schema, temperature)
+and expire by file mtime after Config.LLM_CACHE_TTL_SECONDS. A TTL of 0
+disables the cache.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from .config import Config
+
+
+def cache_key(model: str, input_obj, text_format: dict, temperature: float) -> str:
+    """Stable hash of a request's inputs."""
+    payload = json.dumps(
+        {"model": model, "input": input_obj, "format": text_format, "temperature": temperature},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cache_path(key: str) -> Path:
+    return Config.TEMP_DIR / "llm_cache" / f"{key}.json"
+
+
+def load(key: str) -> str | None:
+    """Return the cached output text for `key`, or None on a miss or expired entry."""
+    if Config.LLM_CACHE_TTL_SECONDS <= 0:
+        return None
+    path = _cache_path(key)
+    try:
+        if time.time() - path.stat().st_mtime > Config.LLM_CACHE_TTL_SECONDS:
+            return None
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def store(key: str, output_text: str) -> None:
+    """Save output text under `key`. Best effort — a failed write only costs a future miss."""
+    if Config.LLM_CACHE_TTL_SECONDS <= 0:
+        return
+    path = _cache_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a concurrent job never reads a half-written entry
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(output_text)
+        os.replace(tmp, path)
+    except OSError:
+        pass
@@ -14,14 +14,14 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from openai import OpenAI
 from PIL import Image
 from rich.console import Console
 
+from . import rate_limit
 from .config import Config
 from .content_input import ContentInput, content_from_pdf
 from .pdf_extractor import PDFExtractor
-from .utils import retry_api as _retry, image_to_data_url
+from .utils import retry_api as _retry, image_to_data_url, openai_client
 
 console = Console()
 
@@ -121,7 +121,7 @@ class PresentationGenerator:
 
     def __init__(self):
         Config.validate()
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
+        self.client = openai_client(Config.OPENAI_API_KEY)
 
     # ── Slide Planning (AI Script) ───────────────────────
 
@@ -250,7 +250,7 @@ Return ONLY valid JSON."""
             input=[{"role": "user", "content": input_content}],
             text={"format": PRESENTATION_SCRIPT_SCHEMA},
             temperature=0.7,
-        ))
+        ), bucket=rate_limit.RESPONSES)
 
         data = json.loads(response.output_text)
 
@@ -345,7 +345,7 @@ CRITICAL REQUIREMENTS:
                 image=self._data_url_to_png_bytes(logo_data_url),
                 prompt=prompt,
                 size="1536x1024",
-            ))
+            ), bucket=rate_limit.IMAGES)
         elif logo_data_url and slide.slide_type != "title":
             prompt += "\n\nInclude a small company logo watermark in the top-right corner of the slide (subtle, semi-transparent). The logo is shown in the reference image."
             response = _retry(lambda: self.client.images.edit(
@@ -353,7 +353,7 @@ CRITICAL REQUIREMENTS:
                 image=self._data_url_to_png_bytes(logo_data_url),
                 prompt=prompt,
                 size="1536x1024",
-            ))
+            ), bucket=rate_limit.IMAGES)
         else:
             response = _retry(lambda: self.client.images.generate(
                 model=Config.OPENAI_IMAGE_MODEL,
@@ -361,7 +361,7 @@ CRITICAL REQUIREMENTS:
                 size="1536x1024",
                 quality="high",
                 n=1,
-            ))
+            ), bucket=rate_limit.IMAGES)
 
         img_b64 = response.data[0].b64_json
         img_bytes = base64.b64decode(img_b64)
@@ -401,7 +401,7 @@ CRITICAL REQUIREMENTS:
             self.generate_slide_image(slide, script.theme, script.title, path, logo_data_url)
             return idx, path
 
-        max_workers = min(4, len(script.slides))
+        max_workers = max(1, min(Config.IMAGE_CONCURRENCY, len(script.slides)))
         with ThreadPoolExecutor(max_workers=max_workers) as pool:
             futures = {
                 pool.submit(_gen_one, i, slide): i
@@ -426,18 +426,23 @@ CRITICAL REQUIREMENTS:
         audio_paths: list[Path | None] = [None] * len(script.slides)
 
         def _gen_one(idx: int, slide: SlideScript) -> tuple[int, Path]:
-            audio_path = output_dir / f"slide_{slide.slide_number:03d}_voice.mp3"
-            response = _retry(lambda: self.client.audio.speech.create(
-                model=Config.OPENAI_TTS_MODEL,
-                voice=selected_voice,
-                input=slide.narration,
-                response_format="mp3",
-                speed=0.95,
-            ))
-            response.stream_to_file(str(audio_path))
+            audio_path = output_dir / f"slide_{slide.slide_number:03d}_voice.{Config.OPENAI_TTS_FORMAT}"
+
+            def _download():
+                # Streamed: audio lands on disk as it arrives, never held whole in memory
+                with self.client.audio.speech.with_streaming_response.create(
+                    model=Config.OPENAI_TTS_MODEL,
+                    voice=selected_voice,
+                    input=slide.narration,
+                    response_format=Config.OPENAI_TTS_FORMAT,
+                    speed=0.95,
+                ) as response:
+                    response.stream_to_file(audio_path)
+
+            _retry(_download, bucket=rate_limit.TTS)
             return idx, audio_path
 
-        max_workers = min(8, len(script.slides))
+        max_workers = max(1, min(Config.TTS_CONCURRENCY, len(script.slides)))
         with ThreadPoolExecutor(max_workers=max_workers) as pool:
             futures = {
                 pool.submit(_gen_one, i, slide): i
@@ -604,6 +609,7 @@ CRITICAL REQUIREMENTS:
             cmd.extend([
                 "-c:v", "h264_nvenc", "-preset", Config.NVENC_PRESET,
                 "-rc", "vbr", "-cq", "19",
+                "-delay", str(Config.NVENC_DELAY),
                 "-b:v", Config.VIDEO_BITRATE,
                 "-pix_fmt", "yuv420p", "-movflags", "+faststart",
                 str(output_path),
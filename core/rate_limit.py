@@ -0,0 +1,46 @@
+"""
+Proactive request pacing for the OpenAI endpoints.
+
+retry_api backs off after a 429; these buckets keep the parallel TTS, image
+and Responses calls under the account's requests-per-minute so the 429s
+mostly never happen. Limits are per process — with several runner
+processes, divide the account's RPM between them. A rate of 0 disables
+pacing for that endpoint.
+"""
+
+import threading
+import time
+
+from .config import Config
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at rate_per_minute."""
+
+    def __init__(self, rate_per_minute: float, burst: float | None = None):
+        self.rate = rate_per_minute / 60.0
+        # Default burst: one second's worth of requests, at least one
+        self.capacity = burst if burst is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until `tokens` are available, then take them."""
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Take the tokens now, going into debt if short, so waiters are
+            # served in arrival order and the sleep happens outside the lock
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+RESPONSES = TokenBucket(Config.OPENAI_RESPONSES_RPM)
+TTS = TokenBucket(Config.OPENAI_TTS_RPM)
+IMAGES = TokenBucket(Config.OPENAI_IMAGES_RPM)
@@ -4,18 +4,46 @@ Shared utilities for the PDF2Video core package.
 
 import base64
 import io
+import threading
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-from openai import APITimeoutError, APIConnectionError, RateLimitError
+from openai import APITimeoutError, APIConnectionError, OpenAI, RateLimitError
 from PIL import Image
 from rich.console import Console
 
+from .config import Config
+
 console = Console()
 
+# One client (and so one connection pool) per API key, shared by every
+# pipeline stage and job in the process
+_clients: dict[str, OpenAI] = {}
+_clients_lock = threading.Lock()
+
+
+def openai_client(api_key: str) -> OpenAI:
+    """Return the process-wide OpenAI client for api_key, creating it on first use."""
+    client = _clients.get(api_key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(api_key)
+            if client is None:
+                client = _clients[api_key] = OpenAI(api_key=api_key)
+    return client
+
+
+def retry_api(fn, max_retries: int = 3, backoff: float = 2.0, bucket=None):
+    """Retry an API call with exponential backoff on transient errors.
 
-def retry_api(fn, max_retries: int = 3, backoff: float = 2.0):
-    """Retry an API call with exponential backoff on transient errors."""
+    With a rate_limit.TokenBucket, every attempt (retries included) waits for
+    a token first so bursts stay under the endpoint's RPM.
+    """
     for attempt in range(max_retries):
+        if bucket is not None:
+            bucket.acquire()
         try:
             return fn()
         except (APITimeoutError, APIConnectionError, RateLimitError) as e:
@@ -26,8 +54,63 @@ def retry_api(fn, max_retries: int = 3, backoff: float = 2.0):
             time.sleep(wait)
 
 
+# Base64 characters decoded per write — a multiple of 4 so chunks split cleanly
+B64_CHUNK_CHARS = 64 * 1024
+
+
+def write_b64_file(b64: str, path: Path) -> Path:
+    """Decode base64 text straight to a file, chunk by chunk, never holding the whole binary."""
+    with open(path, "wb") as f:
+        for start in range(0, len(b64), B64_CHUNK_CHARS):
+            f.write(base64.b64decode(b64[start:start + B64_CHUNK_CHARS]))
+    return path
+
+
+def ensure_rgb(img: Image.Image) -> Image.Image:
+    """Return the image in RGB mode, skipping the full-frame copy when it already is."""
+    if img.mode == "RGB":
+        img.load()
+        return img
+    return img.convert("RGB")
+
+
+# (id(image), max_size) -> data URL. The classifier and the script writer send
+# the same thumbnails, so each image is resized and encoded only once.
+# PIL images aren't hashable, so entries are keyed by id and evicted by a
+# finalizer when their image is collected — before the id can be reused.
+_data_url_cache: dict[tuple[int, int], str] = {}
+
+
 def image_to_data_url(img: Image.Image, max_size: int = 512) -> str:
     """Resize an image and encode as a data URL for the Responses API vision input."""
+    key = (id(img), max_size)
+    url = _data_url_cache.get(key)
+    if url is None:
+        url = _encode_data_url(img, max_size)
+        if _data_url_cache.setdefault(key, url) is url:
+            weakref.finalize(img, _data_url_cache.pop, key, None)
+    return url
+
+
+def images_to_data_urls(images: list[Image.Image], max_size: int = 512) -> list[str | Exception]:
+    """
+    image_to_data_url over many images on a thread pool, in input order.
+    PIL resizes and JPEG-encodes without the GIL, so the threads use separate
+    cores. A failed image yields its exception in place of a URL.
+    """
+    def encode(img: Image.Image) -> str | Exception:
+        try:
+            return image_to_data_url(img, max_size)
+        except Exception as e:
+            return e
+
+    if len(images) <= 1:
+        return [encode(img) for img in images]
+    with ThreadPoolExecutor(max_workers=min(Config.NUM_WORKERS, len(images))) as pool:
+        return list(pool.map(encode, images))
+
+
+def _encode_data_url(img: Image.Image, max_size: int) -> str:
     thumb = img.copy()
     thumb.thumbnail((max_size, max_size), Image.LANCZOS)
     if thumb.mode == "RGBA":
@@ -404,6 +404,7 @@ class VideoComposer:
                 ffmpeg_params=[
                     "-rc", "vbr",
                     "-cq", "28",
+                    "-delay", str(Config.NVENC_DELAY),
                     "-maxrate", "4M",
                     "-bufsize", "8M",
                     "-tag:v", "hvc1",